@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
@@ -14,7 +15,6 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
     CONF_SERIAL,
-    DOMAIN,
     MQTT_PORT,
     MQTT_USE_TLS,
 )
@@ -22,7 +22,7 @@ from .mqtt_client import AzimutMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor", "binary_sensor"]
+PLATFORMS: Final = ["sensor", "binary_sensor"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -42,8 +42,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             f"Failed to connect to MQTT broker at {host}:{MQTT_PORT}"
         )
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.runtime_data = coordinator
+
+    # Start listening before platform setup so the first MQTT messages are
+    # not dropped; the coordinator buffers them until callbacks register
+    await coordinator.async_start_listening()
 
     # Set up all platforms for this device/entry
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -51,9 +54,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register update listener for config entry changes
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    # Start listening for MQTT messages (with auto-reconnect)
-    coordinator.start_listening()
-
     return True
 
 
@@ -61,7 +61,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: AzimutMQTTCoordinator = entry.runtime_data
         await coordinator.async_disconnect()
 
     return unload_ok
@@ -75,6 +75,19 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
 class AzimutMQTTCoordinator:
     """Coordinator for Azimut MQTT connection and message routing."""
 
+    __slots__ = (
+        "hass",
+        "serial",
+        "host",
+        "_mqtt_client",
+        "_listen_task",
+        "_start_lock",
+        "_stopping",
+        "_connection_callbacks",
+        "_pending_discovery",
+        "_pending_state",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -94,46 +107,67 @@ class AzimutMQTTCoordinator:
         )
 
         self._listen_task: asyncio.Task | None = None
-        self._discovery_callback: Callable[[dict[str, Any]], None] | None = None
-        self._state_callback: Callable[[str, float], None] | None = None
-        self._connection_callback: Callable[[bool], None] | None = None
+        self._start_lock = asyncio.Lock()
+        self._stopping = False
 
-        # Set up MQTT client callbacks
-        self._mqtt_client.set_discovery_callback(self._handle_discovery)
-        self._mqtt_client.set_state_callback(self._handle_state)
-        self._mqtt_client.set_connection_callback(self._handle_connection_change)
+        # Connection events fan out to multiple subscribers (sensor platform
+        # and binary_sensor both listen), so the client gets one dispatcher
+        self._connection_callbacks: list[Callable[[bool], None]] = []
+        self._mqtt_client.set_connection_callback(self._dispatch_connection_change)
+
+        # Messages arriving between listen start and platform callback
+        # registration are buffered (bounded) and replayed on registration
+        self._pending_discovery: deque[dict[str, Any]] = deque(maxlen=64)
+        self._pending_state: deque[tuple[str, float]] = deque(maxlen=64)
+        self._mqtt_client.set_discovery_callback(self._pending_discovery.append)
+        self._mqtt_client.set_state_callback(self._buffer_state)
+
+    @callback
+    def _buffer_state(self, state_topic: str, value: float) -> None:
+        """Buffer a state message until the sensor platform registers."""
+        self._pending_state.append((state_topic, value))
+
+    @callback
+    def _dispatch_connection_change(self, connected: bool) -> None:
+        """Fan out a connection state change to all subscribers."""
+        for callback_func in self._connection_callbacks:
+            callback_func(connected)
 
     def set_discovery_callback(
         self, callback_func: Callable[[dict[str, Any]], None]
     ) -> None:
-        """Set callback for discovery messages from sensor platform."""
-        self._discovery_callback = callback_func
+        """Set callback for discovery messages from sensor platform.
+
+        The callback is handed straight to the MQTT client so inbound
+        messages don't pay an extra wrapper call per message. Buffered
+        messages from before registration are replayed first.
+        """
+        self._mqtt_client.set_discovery_callback(callback_func)
+        while self._pending_discovery:
+            callback_func(self._pending_discovery.popleft())
 
     def set_state_callback(self, callback_func: Callable[[str, float], None]) -> None:
         """Set callback for state messages from sensor platform."""
-        self._state_callback = callback_func
+        self._mqtt_client.set_state_callback(callback_func)
+        while self._pending_state:
+            callback_func(*self._pending_state.popleft())
 
-    def set_connection_callback(self, callback_func: Callable[[bool], None]) -> None:
-        """Set callback for connection state changes."""
-        self._connection_callback = callback_func
+    def set_connection_callback(
+        self, callback_func: Callable[[bool], None]
+    ) -> Callable[[], None]:
+        """Subscribe to connection state changes.
 
-    @callback
-    def _handle_discovery(self, payload: dict[str, Any]) -> None:
-        """Handle discovery message from MQTT client."""
-        if self._discovery_callback:
-            self._discovery_callback(payload)
+        Unlike discovery/state, several entities listen for connection
+        events, so subscribers are kept in a list. Returns an unsubscribe
+        callable so entities can detach on removal.
+        """
+        self._connection_callbacks.append(callback_func)
 
-    @callback
-    def _handle_state(self, state_topic: str, value: float) -> None:
-        """Handle state message from MQTT client."""
-        if self._state_callback:
-            self._state_callback(state_topic, value)
+        def _unsubscribe() -> None:
+            if callback_func in self._connection_callbacks:
+                self._connection_callbacks.remove(callback_func)
 
-    @callback
-    def _handle_connection_change(self, connected: bool) -> None:
-        """Handle connection state change from MQTT client."""
-        if self._connection_callback:
-            self._connection_callback(connected)
+        return _unsubscribe
 
     async def async_connect(self) -> bool:
         """Connect to MQTT broker."""
@@ -141,6 +175,7 @@ class AzimutMQTTCoordinator:
 
     async def async_disconnect(self) -> None:
         """Disconnect from MQTT broker."""
+        self._stopping = True
         if self._listen_task:
             self._listen_task.cancel()
             try:
@@ -151,12 +186,45 @@ class AzimutMQTTCoordinator:
 
         await self._mqtt_client.disconnect()
 
-    def start_listening(self) -> None:
-        """Start listening for MQTT messages with auto-reconnect."""
-        if self._listen_task is None:
-            self._listen_task = asyncio.create_task(
-                self._mqtt_client.listen_with_reconnect()
-            )
+    async def async_start_listening(self) -> None:
+        """Start listening for MQTT messages with auto-reconnect.
+
+        Idempotent: a rapid options reload can re-enter setup while the
+        previous listen task is still winding down; the lock ensures only
+        one listen loop ever runs per coordinator.
+        """
+        async with self._start_lock:
+            if self._listen_task is None or self._listen_task.done():
+                self._stopping = False
+                # Background task: Home Assistant cancels it on shutdown, so
+                # the listener never outlives the instance even if unload is
+                # skipped
+                self._listen_task = self.hass.async_create_background_task(
+                    self._supervise(), name=f"azimut_mqtt_listen_{self.serial}"
+                )
+
+    async def _supervise(self) -> None:
+        """Run the listen loop, restarting it if it exits unexpectedly.
+
+        listen_with_reconnect handles MQTT-level errors itself; this guards
+        against a bug in the loop silently killing the integration until a
+        Home Assistant restart.
+        """
+        restarts = 0
+        while not self._stopping:
+            try:
+                await self._mqtt_client.listen_with_reconnect()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception("MQTT listen loop crashed; restarting")
+            else:
+                # A clean return means the client was stopped on purpose
+                return
+            if self._stopping:
+                return
+            await asyncio.sleep(min(2**restarts, 30))
+            restarts += 1
 
     @property
     def is_connected(self) -> bool:
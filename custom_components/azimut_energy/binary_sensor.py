@@ -28,7 +28,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Azimut binary sensors from config entry."""
-    coordinator: AzimutMQTTCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AzimutMQTTCoordinator = entry.runtime_data
     serial = entry.data.get(CONF_SERIAL, "")
 
     # Create connection status binary sensor
@@ -38,9 +38,14 @@ async def async_setup_entry(
 class AzimutConnectionSensor(BinarySensorEntity):
     """Binary sensor representing MQTT connection status."""
 
+    # _attr_* attributes land in the parent's storage; only our own
+    # attributes need slots here
+    __slots__ = ("_coordinator", "_serial", "_device_id", "_unsub_connection")
+
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -62,15 +67,38 @@ class AzimutConnectionSensor(BinarySensorEntity):
             model="Azen Energy System",
         )
 
+        # Broker/port/TLS never change for the entity's lifetime, so build the
+        # attributes dict once instead of on every state write
+        mqtt_client = coordinator.mqtt_client
+        self._attr_extra_state_attributes = {
+            "broker": mqtt_client.host,
+            "port": mqtt_client.port,
+            "tls_enabled": mqtt_client.use_tls,
+        }
+
         # Initial state
         self._attr_is_on = coordinator.is_connected
 
         # Register callback for connection changes
-        coordinator.set_connection_callback(self._handle_connection_change)
+        self._unsub_connection = coordinator.set_connection_callback(
+            self._handle_connection_change
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity is being removed."""
+        await super().async_will_remove_from_hass()
+
+        if self._unsub_connection:
+            self._unsub_connection()
+            self._unsub_connection = None
 
     @callback
     def _handle_connection_change(self, connected: bool) -> None:
         """Handle connection state change."""
+        if self._attr_is_on == connected:
+            # Duplicate transition (e.g. reconnect reported while already
+            # marked connected): skip the state-write pipeline entirely
+            return
         self._attr_is_on = connected
         self.async_write_ha_state()
 
@@ -78,13 +106,3 @@ class AzimutConnectionSensor(BinarySensorEntity):
     def available(self) -> bool:
         """Return True as this sensor should always be available."""
         return True
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
-        """Return extra state attributes."""
-        mqtt_client = self._coordinator.mqtt_client
-        return {
-            "broker": mqtt_client.host,
-            "port": mqtt_client.port,
-            "tls_enabled": mqtt_client.use_tls,
-        }
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import socket
+import ssl
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -19,6 +23,15 @@ from .mqtt_client import AzimutMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Matches "azen-504589" or "Zephyr Azimut Broker on azen-504589"
+_SERIAL_RE = re.compile(r"azen-(\d+)", re.IGNORECASE)
+
+# Timeouts for connection probing (seconds)
+# An unreachable host would otherwise hold the config-flow task for as long
+# as the TLS CONNECT takes to give up, which can be tens of seconds.
+CONNECT_TIMEOUT = 5.0
+DISCONNECT_TIMEOUT = 1.0
+
 # Schema for manual configuration (host + serial only, port is always 8883)
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -27,17 +40,106 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Host-only schema shared by the reconfigure and options steps; the current
+# host is injected as a suggested value instead of recompiling the schema on
+# every form redraw
+STEP_HOST_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+    }
+)
+
 
 def _extract_serial_from_name(name: str) -> str | None:
     """Extract serial number from mDNS name like 'azen-504589'."""
-    # Match patterns like "azen-504589" or "Zephyr Azimut Broker on azen-504589"
-    match = re.search(r"azen-(\d+)", name.lower())
-    if match:
-        return match.group(1)
-    return None
+    match = _SERIAL_RE.search(name)
+    return match.group(1) if match else None
+
+
+class MQTTProbeMixin:
+    """Cache the MQTT probe client across form redraws.
+
+    Probe construction pays an executor hop and TLS setup; a resubmission
+    for the same host/serial (e.g. retrying after a cannot_connect redraw)
+    reuses the previous client and only repeats the network probe itself.
+    The cached client is released when the flow finishes or is dismissed.
+    """
+
+    _probe_client: AzimutMQTTClient | None = None
+
+    async def _async_validate_connection(self, host: str, serial: str) -> bool:
+        """Validate the MQTT connection, reusing the cached probe client."""
+        client = self._probe_client
+        if client is None or client.host != host or client.serial != serial:
+            if client is not None:
+                # Host or serial changed mid-flow; drop the stale client
+                await self._async_release_probe()
+            # Client construction touches the TLS machinery (CA bundle
+            # reads), so keep it off the event loop. Cache it before
+            # probing: a failed connect leaves the client reusable for the
+            # next submission.
+            client = await self.hass.async_add_executor_job(
+                partial(
+                    AzimutMQTTClient,
+                    host=host,
+                    port=MQTT_PORT,
+                    serial=serial,
+                    use_tls=MQTT_USE_TLS,
+                )
+            )
+            self._probe_client = client
+        try:
+            if not await asyncio.wait_for(client.connect(), timeout=CONNECT_TIMEOUT):
+                return False
+        except TimeoutError:
+            _LOGGER.warning(
+                "Timed out connecting to MQTT broker at %s:%s", host, MQTT_PORT
+            )
+            return False
+
+        return True
+
+    async def _async_release_probe(self) -> None:
+        """Drop the cached probe client, disconnecting in the background.
+
+        The result of the MQTT DISCONNECT is not needed, so don't make the
+        user wait for the TLS close roundtrip before the entry is created.
+        """
+        if self._probe_client is None:
+            return
+        client = self._probe_client
+        self._probe_client = None
+
+        async def _disconnect() -> None:
+            try:
+                await asyncio.wait_for(client.disconnect(), timeout=DISCONNECT_TIMEOUT)
+            except TimeoutError:
+                _LOGGER.debug("Timed out disconnecting MQTT probe client")
+            except Exception as err:  # noqa: BLE001 - background close must not raise
+                _LOGGER.debug("Error disconnecting MQTT probe client: %s", err)
+
+        hass = getattr(self, "hass", None)
+        if hass is None:
+            await _disconnect()
+        else:
+            hass.async_create_background_task(
+                _disconnect(), name="azimut_probe_disconnect"
+            )
+
+    @callback
+    def async_remove(self) -> None:
+        """Release the cached probe when the flow is dismissed.
 
+        The successful paths release before creating/updating the entry;
+        this covers an abandoned flow, where the cached client from a
+        failed probe would otherwise linger.
+        """
+        if self._probe_client is not None:
+            self.hass.async_create_task(self._async_release_probe())
+        super().async_remove()
 
-class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+
+class AzimutConfigFlow(MQTTProbeMixin, config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Azimut Energy."""
 
     VERSION = 1
@@ -57,7 +159,10 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, discovery_info: zeroconf.ZeroconfServiceInfo
     ) -> ConfigFlowResult:
         """Handle zeroconf discovery."""
-        _LOGGER.debug("Zeroconf discovery: %s", discovery_info)
+        # ZeroconfServiceInfo has a non-trivial repr; don't build it unless
+        # debug logging is actually on (mDNS bursts can be chatty)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Zeroconf discovery: %s", discovery_info)
 
         # Extract host from discovery
         self._discovered_host = str(discovery_info.host)
@@ -96,27 +201,41 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate MQTT connection
+            # Validate MQTT connection; resolve the discovered host in the
+            # executor concurrently so DNS lookup and TLS handshake overlap
+            # instead of serializing.
             try:
-                client = AzimutMQTTClient(
-                    host=self._discovered_host,
-                    port=MQTT_PORT,
-                    serial=self._discovered_serial,
-                    use_tls=MQTT_USE_TLS,
+                ok, resolved = await asyncio.gather(
+                    self._async_validate_connection(
+                        self._discovered_host, self._discovered_serial
+                    ),
+                    self.hass.async_add_executor_job(
+                        socket.gethostbyname, self._discovered_host
+                    ),
+                    return_exceptions=True,
                 )
+                if isinstance(ok, BaseException):
+                    raise ok
+                if not isinstance(resolved, str):
+                    # Resolution failed; keep the discovered host as-is.
+                    resolved = self._discovered_host
 
-                if not await client.connect():
+                if not ok:
                     errors["base"] = "cannot_connect"
                 else:
-                    await client.disconnect()
+                    await self._async_release_probe()
                     return self.async_create_entry(
                         title=f"Azimut Battery {self._discovered_serial}",
                         data={
-                            CONF_HOST: self._discovered_host,
+                            CONF_HOST: resolved,
                             CONF_SERIAL: self._discovered_serial,
                         },
                     )
 
+            except (OSError, TimeoutError, ssl.SSLError) as err:
+                # Expected network failures: no traceback capture needed
+                _LOGGER.warning("MQTT probe failed: %s", err)
+                errors["base"] = "cannot_connect"
             except Exception as err:
                 _LOGGER.exception("Failed to validate MQTT connection: %s", err)
                 errors["base"] = "cannot_connect"
@@ -146,17 +265,10 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             # Validate MQTT connection
             try:
-                client = AzimutMQTTClient(
-                    host=host,
-                    port=MQTT_PORT,
-                    serial=serial,
-                    use_tls=MQTT_USE_TLS,
-                )
-
-                if not await client.connect():
+                if not await self._async_validate_connection(host, serial):
                     errors["base"] = "cannot_connect"
                 else:
-                    await client.disconnect()
+                    await self._async_release_probe()
                     return self.async_create_entry(
                         title=f"Azimut Battery {serial}",
                         data={
@@ -165,6 +277,10 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
+            except (OSError, TimeoutError, ssl.SSLError) as err:
+                # Expected network failures: no traceback capture needed
+                _LOGGER.warning("MQTT probe failed: %s", err)
+                errors["base"] = "cannot_connect"
             except Exception as err:
                 _LOGGER.exception("Failed to validate MQTT connection: %s", err)
                 errors["base"] = "cannot_connect"
@@ -188,17 +304,12 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Validate MQTT connection with new settings
             try:
-                client = AzimutMQTTClient(
-                    host=user_input[CONF_HOST],
-                    port=MQTT_PORT,
-                    serial=entry.data[CONF_SERIAL],
-                    use_tls=MQTT_USE_TLS,
-                )
-
-                if not await client.connect():
+                if not await self._async_validate_connection(
+                    user_input[CONF_HOST], entry.data[CONF_SERIAL]
+                ):
                     errors["base"] = "cannot_connect"
                 else:
-                    await client.disconnect()
+                    await self._async_release_probe()
                     return self.async_update_reload_and_abort(
                         entry,
                         data={
@@ -207,23 +318,25 @@ class AzimutConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
+            except (OSError, TimeoutError, ssl.SSLError) as err:
+                # Expected network failures: no traceback capture needed
+                _LOGGER.warning("MQTT probe failed: %s", err)
+                errors["base"] = "cannot_connect"
             except Exception as err:
                 _LOGGER.exception("Failed to validate MQTT connection: %s", err)
                 errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=entry.data.get(CONF_HOST, "")): str,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_HOST_SCHEMA, {CONF_HOST: entry.data.get(CONF_HOST, "")}
             ),
             errors=errors,
             description_placeholders={"serial": entry.data.get(CONF_SERIAL, "")},
         )
 
 
-class AzimutOptionsFlow(OptionsFlow):
+class AzimutOptionsFlow(MQTTProbeMixin, OptionsFlow):
     """Handle options flow for Azimut Energy."""
 
     async def async_step_init(
@@ -235,17 +348,12 @@ class AzimutOptionsFlow(OptionsFlow):
         if user_input is not None:
             # Validate MQTT connection with new settings
             try:
-                client = AzimutMQTTClient(
-                    host=user_input[CONF_HOST],
-                    port=MQTT_PORT,
-                    serial=self.config_entry.data[CONF_SERIAL],
-                    use_tls=MQTT_USE_TLS,
-                )
-
-                if not await client.connect():
+                if not await self._async_validate_connection(
+                    user_input[CONF_HOST], self.config_entry.data[CONF_SERIAL]
+                ):
                     errors["base"] = "cannot_connect"
                 else:
-                    await client.disconnect()
+                    await self._async_release_probe()
                     # Update the config entry
                     self.hass.config_entries.async_update_entry(
                         self.config_entry,
@@ -256,19 +364,19 @@ class AzimutOptionsFlow(OptionsFlow):
                     )
                     return self.async_create_entry(title="", data={})
 
+            except (OSError, TimeoutError, ssl.SSLError) as err:
+                # Expected network failures: no traceback capture needed
+                _LOGGER.warning("MQTT probe failed: %s", err)
+                errors["base"] = "cannot_connect"
             except Exception as err:
                 _LOGGER.exception("Failed to validate MQTT connection: %s", err)
                 errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_HOST,
-                        default=self.config_entry.data.get(CONF_HOST, ""),
-                    ): str,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_HOST_SCHEMA,
+                {CONF_HOST: self.config_entry.data.get(CONF_HOST, "")},
             ),
             errors=errors,
         )
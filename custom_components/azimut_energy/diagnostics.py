@@ -9,28 +9,28 @@ from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from .const import CONF_SERIAL, DOMAIN, MQTT_PORT
+from .const import CONF_SERIAL, MQTT_PORT, get_discovery_topic, get_state_topic
 
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    coordinator = getattr(entry, "runtime_data", None)
+    serial = entry.data.get(CONF_SERIAL)
 
     # Gather sensor information
     sensors_info = []
     if coordinator:
-        # Get all entities for this config entry
+        # Get all entities for this config entry (indexed lookup, not a
+        # scan over the whole registry)
         entity_registry = er.async_get(hass)
-        entities = [
-            entity
-            for entity in entity_registry.entities.values()
-            if entity.config_entry_id == entry.entry_id
-        ]
+        entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
 
+        # Bind the lookup once rather than walking hass.states.get per entity
+        state_get = hass.states.get
         for entity in entities:
-            state = hass.states.get(entity.entity_id)
+            state = state_get(entity.entity_id)
             sensors_info.append(
                 {
                     "entity_id": entity.entity_id,
@@ -65,13 +65,13 @@ async def async_get_config_entry_diagnostics(
         "connection": {
             "host": entry.data.get(CONF_HOST),
             "port": MQTT_PORT,
-            "serial": entry.data.get(CONF_SERIAL),
+            "serial": serial,
             "connected": coordinator.is_connected if coordinator else False,
             "tls_enabled": True,
         },
         "mqtt_topics": {
-            "discovery": f"homeassistant/sensor/azen_{entry.data.get(CONF_SERIAL)}/+/config",
-            "state": f"azen/{entry.data.get(CONF_SERIAL)}/sensor/+/state",
+            "discovery": get_discovery_topic(serial),
+            "state": get_state_topic(serial),
         },
         "mqtt_statistics": mqtt_stats,
         "sensors": {
@@ -5,13 +5,22 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import re
+import random
 import ssl
+import sys
+import time
 from collections.abc import Callable
 from typing import Any
 
 import aiomqtt
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    _json_loads = json.loads
+
 from .const import (
     MQTT_KEEPALIVE,
     get_discovery_topic,
@@ -20,15 +29,59 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# One no-verify TLS context shared by every client instance. SSLContext is
+# thread-safe and reusable across connections, and the unverified context
+# skips the system CA bundle entirely (it would be dead weight with
+# CERT_NONE anyway).
+_UNVERIFIED_TLS_CONTEXT = ssl._create_unverified_context()
+
 # Reconnection settings
 INITIAL_RECONNECT_DELAY = 1  # Start with 1 second
 MAX_RECONNECT_DELAY = 30  # Max 30 seconds between retries
 MESSAGE_TIMEOUT = 120  # Consider connection dead if no message for 2 minutes
+STATE_FLUSH_DELAY = 0.05  # Coalescing window for state updates (seconds)
+# Bound on aiomqtt's incoming-message queue. Unbounded (the default) lets a
+# stalled consumer grow memory without limit; at Azimut's publish rate 1024
+# messages is minutes of headroom, and dropping beyond that only loses
+# last-value state updates that the next publish replaces anyway.
+MAX_QUEUED_MESSAGES = 1024
 
 
 class AzimutMQTTClient:
     """MQTT client for Azimut Energy System with automatic reconnection."""
 
+    # Slotted: attribute reads in the message loop skip the instance dict,
+    # and a client is a long-lived singleton per entry anyway
+    __slots__ = (
+        "host",
+        "port",
+        "serial",
+        "use_tls",
+        "_client",
+        "_running",
+        "_stop_event",
+        "_connected",
+        "_reconnect_delay",
+        "_last_message_time",
+        "_connection_count",
+        "_reconnect_count",
+        "_last_connect_time",
+        "_last_disconnect_time",
+        "_total_messages_received",
+        "_discovery_callback",
+        "_state_callback",
+        "_connection_callback",
+        "_pending_states",
+        "_flush_handle",
+        "_tls_context",
+        "_discovery_topic",
+        "_state_topic",
+        "_disc_prefix",
+        "_disc_suffix",
+        "_state_prefix",
+        "_state_suffix",
+    )
+
     def __init__(
         self,
         host: str,
@@ -37,6 +90,12 @@ class AzimutMQTTClient:
         use_tls: bool = False,
     ) -> None:
         """Initialize the MQTT client."""
+        # Serials are fixed alphanumeric device IDs; validating here is what
+        # lets the topic prefixes below be built as plain literals without
+        # any escaping
+        if serial and not all(c.isalnum() or c in "-_" for c in serial):
+            raise ValueError(f"Invalid serial number: {serial!r}")
+
         self.host = host
         self.port = port
         self.serial = serial
@@ -44,6 +103,8 @@ class AzimutMQTTClient:
 
         self._client: aiomqtt.Client | None = None
         self._running = False
+        # Set by disconnect() to wake any backoff wait immediately
+        self._stop_event = asyncio.Event()
         self._connected = False
         self._reconnect_delay = INITIAL_RECONNECT_DELAY
         self._last_message_time: float = 0
@@ -60,22 +121,29 @@ class AzimutMQTTClient:
         self._state_callback: Callable[[str, float], None] | None = None
         self._connection_callback: Callable[[bool], None] | None = None
 
-        # TLS context - created lazily to avoid blocking in __init__
-        self._tls_context: ssl.SSLContext | None = None
+        # State updates are coalesced over a short window so a burst of
+        # per-sensor publishes becomes one callback per topic (last value
+        # wins) instead of one Home Assistant state write per message
+        self._pending_states: dict[str, float] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # TLS context - built once and reused for every connection attempt.
+        # SSLContext is designed to be shared across connections; rebuilding
+        # it per reconnect wastes an OpenSSL context allocation each time.
+        self._tls_context = self._create_tls_context()
 
         # Topic patterns
         self._discovery_topic = get_discovery_topic(serial)
         self._state_topic = get_state_topic(serial)
 
-        # Regex patterns for parsing topics
-        # Discovery: homeassistant/sensor/azen_{serial}/{sensor_id}/config
-        self._discovery_pattern = re.compile(
-            rf"homeassistant/sensor/azen_{re.escape(serial)}/([^/]+)/config"
-        )
-        # State: azen/{serial}/sensor/{sensor_id}/state
-        self._state_pattern = re.compile(
-            rf"azen/{re.escape(serial)}/sensor/([^/]+)/state"
-        )
+        # Topic prefixes/suffixes for parsing. The topic structure is fixed
+        # (homeassistant/sensor/azen_{serial}/{sensor_id}/config and
+        # azen/{serial}/sensor/{sensor_id}/state), so plain startswith/endswith
+        # beats regex matching on the hot message path.
+        self._disc_prefix = f"homeassistant/sensor/azen_{serial}/"
+        self._disc_suffix = "/config"
+        self._state_prefix = f"azen/{serial}/sensor/"
+        self._state_suffix = "/state"
 
     def set_discovery_callback(
         self, callback: Callable[[dict[str, Any]], None]
@@ -97,30 +165,37 @@ class AzimutMQTTClient:
         """
         self._connection_callback = callback
 
+    def _build_client(self, tls_context: ssl.SSLContext | None) -> aiomqtt.Client:
+        """Build an aiomqtt client (aiomqtt clients are single-use).
+
+        clean_session=False with the stable identifier lets the broker keep
+        the session and its subscriptions across short transport blips, so a
+        reconnect doesn't lose messages queued broker-side in the meantime.
+        """
+        return aiomqtt.Client(
+            hostname=self.host,
+            port=self.port,
+            tls_context=tls_context,
+            identifier=f"ha_azimut_{self.serial}",
+            keepalive=MQTT_KEEPALIVE,
+            clean_session=False,
+            max_queued_incoming_messages=MAX_QUEUED_MESSAGES,
+        )
+
     def _create_tls_context(self) -> ssl.SSLContext | None:
-        """Create TLS context if TLS is enabled (synchronous, for executor)."""
+        """Return the shared TLS context if TLS is enabled.
+
+        Verification is disabled (the broker uses a self-signed cert), so
+        all clients can share one module-level context instead of paying an
+        OpenSSL context allocation per instance.
+        """
         if not self.use_tls:
             return None
-        tls_context = ssl.create_default_context()
-        tls_context.check_hostname = False
-        tls_context.verify_mode = ssl.CERT_NONE
-        return tls_context
-
-    async def _get_tls_context(self) -> ssl.SSLContext | None:
-        """Get or create TLS context asynchronously (non-blocking)."""
-        if self._tls_context is None:
-            # Run blocking SSL context creation in executor
-            loop = asyncio.get_running_loop()
-            self._tls_context = await loop.run_in_executor(
-                None, self._create_tls_context
-            )
-        return self._tls_context
+        return _UNVERIFIED_TLS_CONTEXT
 
     def _notify_connected(self) -> None:
         """Notify that connection is established."""
         if not self._connected:
-            import time
-
             self._connected = True
             self._reconnect_delay = INITIAL_RECONNECT_DELAY  # Reset on success
             self._last_connect_time = time.time()
@@ -133,8 +208,6 @@ class AzimutMQTTClient:
     def _notify_disconnected(self) -> None:
         """Notify that connection is lost."""
         if self._connected:
-            import time
-
             self._connected = False
             self._last_disconnect_time = time.time()
             if self._connection_callback:
@@ -143,16 +216,7 @@ class AzimutMQTTClient:
     async def connect(self) -> bool:
         """Connect to MQTT broker (for initial validation only)."""
         try:
-            # Get TLS context asynchronously (non-blocking)
-            tls_context = await self._get_tls_context()
-
-            client = aiomqtt.Client(
-                hostname=self.host,
-                port=self.port,
-                tls_context=tls_context,
-                identifier=f"ha_azimut_{self.serial}",
-                keepalive=MQTT_KEEPALIVE,
-            )
+            client = self._build_client(self._tls_context)
 
             await client.__aenter__()
 
@@ -178,6 +242,13 @@ class AzimutMQTTClient:
     async def disconnect(self) -> None:
         """Disconnect from MQTT broker."""
         self._running = False
+        self._stop_event.set()
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_states.clear()
+
         self._notify_disconnected()
 
         if self._client:
@@ -191,21 +262,13 @@ class AzimutMQTTClient:
     async def listen_with_reconnect(self) -> None:
         """Listen for MQTT messages with automatic reconnection."""
         self._running = True
-        import time
-
-        # Get TLS context once before loop (non-blocking)
-        tls_context = await self._get_tls_context()
+        self._stop_event.clear()
 
         while self._running:
             try:
-                # Create new client for each connection attempt
-                self._client = aiomqtt.Client(
-                    hostname=self.host,
-                    port=self.port,
-                    tls_context=tls_context,
-                    identifier=f"ha_azimut_{self.serial}",
-                    keepalive=MQTT_KEEPALIVE,
-                )
+                # aiomqtt clients cannot be re-entered after exit, so a new
+                # one is needed per attempt; the TLS context is reused
+                self._client = self._build_client(self._tls_context)
 
                 async with self._client:
                     # Subscribe to topics
@@ -254,97 +317,164 @@ class AzimutMQTTClient:
             # Wait before reconnecting (with early exit check)
             if self._running:
                 await self._sleep_with_check(self._reconnect_delay)
-                # Exponential backoff
+                # Decorrelated-jitter backoff: spreads reconnect attempts so
+                # clients don't stampede a restarting broker in lockstep
                 self._reconnect_delay = min(
-                    self._reconnect_delay * 2, MAX_RECONNECT_DELAY
+                    MAX_RECONNECT_DELAY,
+                    random.uniform(INITIAL_RECONNECT_DELAY, self._reconnect_delay * 3),
                 )
 
     async def _sleep_with_check(self, seconds: float) -> None:
-        """Sleep for specified seconds, but check _running periodically."""
-        end_time = asyncio.get_event_loop().time() + seconds
-        while asyncio.get_event_loop().time() < end_time and self._running:
-            await asyncio.sleep(min(1.0, end_time - asyncio.get_event_loop().time()))
+        """Wait up to `seconds`, waking immediately if disconnect() is called.
+
+        Event-driven rather than polled: no 1-second wakeups during the
+        backoff window, and shutdown is not delayed by up to a second.
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
 
     async def _listen_loop_with_timeout(self) -> None:
         """Listen for messages with a timeout to detect dead connections."""
-        import time
-
-        if not self._client:
+        client = self._client
+        if not client:
             return
 
-        async for message in self._client.messages:
-            if not self._running:
-                break
-
-            self._last_message_time = time.monotonic()
-
-            topic = str(message.topic)
-            self._total_messages_received += 1
-
-            try:
-                payload = message.payload.decode()
-            except UnicodeDecodeError:
-                _LOGGER.debug("Failed to decode payload on topic %s", topic)
-                continue
-
-            try:
-                # Check if this is a discovery message
-                discovery_match = self._discovery_pattern.match(topic)
-                if discovery_match:
-                    self._handle_discovery_message(payload)
-                    continue
-
-                # Check if this is a state message
-                state_match = self._state_pattern.match(topic)
-                if state_match:
-                    self._handle_state_message(topic, payload)
-                    continue
-
-                _LOGGER.debug("Unhandled topic: %s", topic)
-
-            except Exception as err:
-                _LOGGER.debug("Error processing MQTT message on %s: %s", topic, err)
-
-    def _handle_discovery_message(self, payload: str) -> None:
+        # Bind hot-loop lookups once: LOAD_FAST beats LOAD_ATTR per message
+        monotonic = time.monotonic
+        disc_prefix = self._disc_prefix
+        disc_suffix = self._disc_suffix
+        state_prefix = self._state_prefix
+        state_suffix = self._state_suffix
+        disc_start = len(disc_prefix)
+        disc_end = -len(disc_suffix)
+        state_start = len(state_prefix)
+        state_end = -len(state_suffix)
+        handle_discovery = self._handle_discovery_message
+        handle_state = self._handle_state_message
+
+        # Sliding deadline: if the broker goes silent for MESSAGE_TIMEOUT
+        # the TCP socket may be dead without the OS noticing; surface it as
+        # an MqttError so listen_with_reconnect tears down and reconnects
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(MESSAGE_TIMEOUT) as deadline:
+                async for message in client.messages:
+                    if not self._running:
+                        break
+
+                    self._last_message_time = monotonic()
+                    deadline.reschedule(loop.time() + MESSAGE_TIMEOUT)
+
+                    # .value reads the underlying str without the __str__
+                    # call; interning it keeps the downstream dict probes on
+                    # the pointer-equality fast path
+                    topic = sys.intern(message.topic.value)
+                    self._total_messages_received += 1
+
+                    # Both handlers accept raw bytes (orjson and float() do
+                    # too), so skip the per-message UTF-8 decode allocation
+                    payload = message.payload
+
+                    try:
+                        # State messages are the high-rate path, so test them
+                        # first; startswith/endswith gate on length in C
+                        # before comparing bytes. The middle segment must be
+                        # a single topic level, matching the [^/]+ of the old
+                        # regex patterns.
+                        if (
+                            topic.startswith(state_prefix)
+                            and topic.endswith(state_suffix)
+                            and "/" not in topic[state_start:state_end]
+                        ):
+                            handle_state(topic, payload)
+                            continue
+
+                        # Check if this is a discovery message
+                        if (
+                            topic.startswith(disc_prefix)
+                            and topic.endswith(disc_suffix)
+                            and "/" not in topic[disc_start:disc_end]
+                        ):
+                            handle_discovery(payload)
+                            continue
+
+                        _LOGGER.debug("Unhandled topic: %s", topic)
+
+                    except Exception as err:
+                        _LOGGER.debug(
+                            "Error processing MQTT message on %s: %s", topic, err
+                        )
+        except TimeoutError:
+            raise aiomqtt.MqttError(
+                f"No MQTT message received for {MESSAGE_TIMEOUT} seconds"
+            ) from None
+
+    def _handle_discovery_message(self, payload: bytes | str) -> None:
         """Handle a discovery message (JSON payload)."""
         try:
-            data = json.loads(payload)
-
-            # Handle double-encoded JSON (string inside JSON)
-            if isinstance(data, str):
-                data = json.loads(data)
+            # Double-encoded payloads (JSON string wrapping JSON) announce
+            # themselves with a leading quote; branch on that one byte
+            # instead of type-checking every parse result
+            if payload.lstrip()[:1] in (b'"', '"'):
+                data = _json_loads(_json_loads(payload))
+            else:
+                data = _json_loads(payload)
 
-            _LOGGER.debug("Received discovery message: %s", data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received discovery message: %s", data)
 
             if self._discovery_callback and isinstance(data, dict):
                 self._discovery_callback(data)
 
-        except json.JSONDecodeError as err:
+        except ValueError as err:
             _LOGGER.debug("Failed to decode discovery JSON: %s", err)
 
-    def _handle_state_message(self, topic: str, payload: str) -> None:
+    def _handle_state_message(self, topic: str, payload: bytes | str) -> None:
         """Handle a state message (numeric string, possibly JSON-encoded)."""
+        # Azimut publishes plain numeric strings like "344.00", with the
+        # occasional JSON-quoted variant ("\"344.00\""). Peek at the first
+        # byte to pick the path up front so well-formed quoted payloads
+        # don't pay a raised-and-caught ValueError before being handled.
+        if payload[:1] in (b'"', '"'):
+            text = payload.decode() if isinstance(payload, bytes) else payload
+            text = text.strip()
+            if len(text) >= 2 and text[-1] == '"':
+                payload = text[1:-1]
+            else:
+                _LOGGER.debug("Failed to parse state value '%s'", text)
+                return
         try:
-            # Try to parse as JSON first (in case it's a quoted string like "344.00")
-            try:
-                parsed = json.loads(payload)
-                if isinstance(parsed, (int, float)):
-                    value = float(parsed)
-                elif isinstance(parsed, str):
-                    value = float(parsed)
-                else:
-                    raise ValueError(f"Unexpected type: {type(parsed)}")
-            except json.JSONDecodeError:
-                # Not JSON, try direct float conversion
-                value = float(payload)
+            value = float(payload)
+        except ValueError:
+            _LOGGER.debug("Failed to parse state value '%s'", payload)
+            return
 
+        # debug() does its own level check, but the guard keeps the wrapper
+        # call and its args tuple off the per-message path when DEBUG is off
+        # (the common case). Checked per call, not cached: Home Assistant can
+        # change logger levels at runtime via the logger service.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Received state update on %s: %s", topic, value)
 
-            if self._state_callback:
-                self._state_callback(topic, value)
+        self._pending_states[topic] = value
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                STATE_FLUSH_DELAY, self._flush_states
+            )
 
-        except ValueError as err:
-            _LOGGER.debug("Failed to parse state value '%s': %s", payload, err)
+    def _flush_states(self) -> None:
+        """Dispatch the coalesced state updates, latest value per topic."""
+        if self._flush_handle is not None:
+            # No-op when fired by the timer itself, but an early flush
+            # (e.g. on disconnect) must not leave the timer scheduled
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending_states = self._pending_states, {}
+        if self._state_callback:
+            for topic, value in pending.items():
+                self._state_callback(topic, value)
 
     @property
     def is_connected(self) -> bool:
@@ -380,8 +510,3 @@ class AzimutMQTTClient:
     def total_messages_received(self) -> int:
         """Return total number of MQTT messages received."""
         return self._total_messages_received
-
-    # Keep old method for backwards compatibility
-    async def listen(self) -> None:
-        """Listen for MQTT messages (legacy method, use listen_with_reconnect)."""
-        await self.listen_with_reconnect()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
@@ -25,6 +27,10 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# One shared sweep for sensor expiration; half the default expire_after so
+# a stale sensor is flagged within ~1.5x its window
+EXPIRE_CHECK_INTERVAL = timedelta(seconds=min(DEFAULT_EXPIRE_AFTER / 2, 60))
+
 # Map string device classes to SensorDeviceClass enum
 DEVICE_CLASS_MAP: dict[str, SensorDeviceClass] = {
     "power": SensorDeviceClass.POWER,
@@ -43,18 +49,37 @@ STATE_CLASS_MAP: dict[str, SensorStateClass] = {
 }
 
 
+@lru_cache(maxsize=8)
+def _diagnostic_device_info(serial: str) -> DeviceInfo:
+    """Return the shared DeviceInfo for a device's diagnostic sensors.
+
+    All diagnostic sensors of one device carry identical device metadata;
+    caching it means one DeviceInfo per device instead of one per entity.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"azen_{serial}")},
+        name=f"Azen {serial}",
+        manufacturer="Azimut",
+        model="Azen Energy System",
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Azimut sensors from config entry."""
-    coordinator: AzimutMQTTCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AzimutMQTTCoordinator = entry.runtime_data
     serial = entry.data.get(CONF_SERIAL, "")
 
     # Track created sensors by unique_id to avoid duplicates
     created_sensors: dict[str, AzimutSensor] = {}
 
+    # State updates are routed by topic; a dict probe keeps the per-message
+    # cost O(1) instead of scanning every created sensor
+    topic_index: dict[str, AzimutSensor] = {}
+
     # Create diagnostic sensors
     sensor_count_diag = AzimutDiagnosticSensor(
         coordinator=coordinator,
@@ -102,6 +127,7 @@ async def async_setup_entry(
             serial=serial,
         )
         created_sensors[unique_id] = sensor
+        topic_index[sensor.state_topic] = sensor
 
         # Update sensor count
         sensor_count_diag.increment_sensor_count()
@@ -113,10 +139,10 @@ async def async_setup_entry(
     @callback
     def handle_state_update(state_topic: str, value: float) -> None:
         """Handle state update and route to correct sensor."""
-        for sensor in created_sensors.values():
-            if sensor.state_topic == state_topic:
-                sensor.update_value(value)
-                return
+        sensor = topic_index.get(state_topic)
+        if sensor is not None:
+            sensor.update_value(value)
+            return
 
         _LOGGER.debug("No sensor found for state topic: %s", state_topic)
 
@@ -129,11 +155,25 @@ async def async_setup_entry(
                 sensor.set_connection_available(False)
         # When connected, sensors will become available when they receive data
 
+    @callback
+    def check_expiration(now: datetime) -> None:
+        """Expire sensors that stopped receiving updates."""
+        for sensor in created_sensors.values():
+            sensor._check_expiration(now)
+
     # Register callbacks with coordinator
     coordinator.set_discovery_callback(handle_discovery)
     coordinator.set_state_callback(handle_state_update)
     coordinator.set_connection_callback(handle_connection_change)
 
+    # A single platform-level sweep replaces one timer per sensor: N
+    # sensors previously meant N wakeups per interval
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, check_expiration, EXPIRE_CHECK_INTERVAL, cancel_on_shutdown=True
+        )
+    )
+
 
 class AzimutSensor(SensorEntity):
     """Azimut sensor entity created from MQTT discovery."""
@@ -152,7 +192,9 @@ class AzimutSensor(SensorEntity):
 
         # Extract fields from discovery payload
         self._attr_unique_id = payload.get("unique_id", "")
-        self._state_topic = payload.get("state_topic", "")
+        # Interned to match the interned inbound topics, so the per-message
+        # topic_index lookup compares by pointer
+        self._state_topic = sys.intern(payload.get("state_topic", ""))
 
         # Extract translation key from unique_id (e.g., "azen_123_battery_soc" -> "battery_soc")
         # This allows entity names to be translated
@@ -171,15 +213,15 @@ class AzimutSensor(SensorEntity):
         self._attr_native_unit_of_measurement = payload.get("unit_of_measurement")
         self._attr_icon = payload.get("icon")
 
-        # Map device class string to enum
-        device_class_str = payload.get("device_class")
-        if device_class_str and device_class_str in DEVICE_CLASS_MAP:
-            self._attr_device_class = DEVICE_CLASS_MAP[device_class_str]
+        # Map device class string to enum (single probe; .get tolerates None)
+        device_class = DEVICE_CLASS_MAP.get(payload.get("device_class"))
+        if device_class is not None:
+            self._attr_device_class = device_class
 
         # Map state class string to enum
-        state_class_str = payload.get("state_class")
-        if state_class_str and state_class_str in STATE_CLASS_MAP:
-            self._attr_state_class = STATE_CLASS_MAP[state_class_str]
+        state_class = STATE_CLASS_MAP.get(payload.get("state_class"))
+        if state_class is not None:
+            self._attr_state_class = state_class
 
         # Entity category from discovery payload
         entity_category_str = payload.get("entity_category")
@@ -188,10 +230,9 @@ class AzimutSensor(SensorEntity):
         elif entity_category_str == "config":
             self._attr_entity_category = EntityCategory.CONFIG
 
-        # Expiration for availability
+        # Expiration for availability (checked by the platform-level sweep)
         self._expire_after = payload.get("expire_after", DEFAULT_EXPIRE_AFTER)
         self._last_update: datetime | None = None
-        self._unsub_expire_check: Any = None
         self._mqtt_connected = True
 
         # Device info from payload
@@ -236,30 +277,10 @@ class AzimutSensor(SensorEntity):
             self._attr_available = False
             self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-
-        # Set up periodic check for expiration
-        if self._expire_after > 0:
-            self._unsub_expire_check = async_track_time_interval(
-                self.hass,
-                self._check_expiration,
-                timedelta(seconds=min(self._expire_after / 2, 60)),
-            )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        await super().async_will_remove_from_hass()
-
-        if self._unsub_expire_check:
-            self._unsub_expire_check()
-            self._unsub_expire_check = None
-
     @callback
     def _check_expiration(self, now: datetime) -> None:
         """Check if sensor has expired due to no updates."""
-        if self._last_update is None:
+        if self._expire_after <= 0 or self._last_update is None:
             return
 
         # Only check expiration if MQTT is connected
@@ -294,6 +315,9 @@ class AzimutDiagnosticSensor(SensorEntity):
     ) -> None:
         """Initialize the diagnostic sensor."""
         self._coordinator = coordinator
+        # Cache the client reference: native_value reads statistics on every
+        # state write and shouldn't walk coordinator properties each time
+        self._mqtt_client = coordinator.mqtt_client
         self._serial = serial
         self._sensor_type = sensor_type
         self._device_id = f"azen_{serial}"
@@ -302,13 +326,8 @@ class AzimutDiagnosticSensor(SensorEntity):
         # Don't set name - let HA use translation_key following best practices
         self._attr_icon = icon
 
-        # Device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=f"Azen {serial}",
-            manufacturer="Azimut",
-            model="Azen Energy System",
-        )
+        # Device info (shared across this device's diagnostic sensors)
+        self._attr_device_info = _diagnostic_device_info(serial)
 
         # Track sensor count for sensor_count type
         self._sensor_count = 0
@@ -321,12 +340,10 @@ class AzimutDiagnosticSensor(SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        mqtt_client = self._coordinator.mqtt_client
-
         if self._sensor_type == "reconnect_count":
-            return mqtt_client.reconnect_count
+            return self._mqtt_client.reconnect_count
         elif self._sensor_type == "total_messages":
-            return mqtt_client.total_messages_received
+            return self._mqtt_client.total_messages_received
         elif self._sensor_type == "sensor_count":
             return self._sensor_count
 
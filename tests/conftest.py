@@ -2,29 +2,46 @@
 
 from __future__ import annotations
 
-import sys
+import os
 from collections.abc import Generator
-from pathlib import Path
+from contextlib import contextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-# Add the workspace root to Python path for imports
-workspace_root = Path(__file__).parent.parent
-if str(workspace_root) not in sys.path:
-    sys.path.insert(0, str(workspace_root))
-
-# Import after module setup
-from custom_components.azimut_energy.const import (  # noqa: E402, I001
+# The repo root is on sys.path via the pythonpath setting in pyproject.toml,
+# so the package imports like any installed one
+from custom_components.azimut_energy.const import (  # noqa: I001
     CONF_SERIAL,
     DOMAIN,
 )
+from custom_components.azimut_energy.mqtt_client import AzimutMQTTClient
 
 # Import pytest_homeassistant_custom_component fixtures
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Disable .pytest_cache writes unless explicitly opted in.
+
+    The cache only feeds --lf/--ff; skipping it saves the per-session
+    cache-dir writes. Set PYTEST_WANT_CACHE=1 to get it back.
+    """
+    if not os.environ.get("PYTEST_WANT_CACHE"):
+        # cacheprovider's own configure hook is tryfirst, so its sub-plugins
+        # already exist here and can be unregistered alongside it
+        for name in ("cacheprovider", "lfplugin", "nfplugin", "stepwise"):
+            plugin = config.pluginmanager.get_plugin(name)
+            if plugin is not None:
+                config.pluginmanager.unregister(plugin)
+        config.cache = None
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations for all tests."""
@@ -41,60 +58,139 @@ def mock_setup_entry() -> Generator[AsyncMock, None, None]:
         yield mock_setup
 
 
-@pytest.fixture
-def mock_mqtt_client() -> Generator[MagicMock, None, None]:
-    """Mock the AzimutMQTTClient."""
+# Constant attributes for the mocked MQTT client, built once at import time.
+# Mocks that record calls are still created per test: copy.copy on a mock
+# shares its call bookkeeping, so a copied template would leak calls across
+# tests.
+_MQTT_CLIENT_ATTRS = {
+    "connection_count": 1,
+    "reconnect_count": 0,
+    "total_messages_received": 0,
+    "last_message_time": 0.0,
+    "last_connect_time": 1234567890.0,
+    "last_disconnect_time": None,
+    "host": "192.168.1.100",
+    "port": 8883,
+    "use_tls": True,
+}
+
+
+@contextmanager
+def _patch_mqtt_client(connect_result: bool) -> Generator[MagicMock, None, None]:
+    """Patch AzimutMQTTClient with a preconfigured instance mock.
+
+    One shared body for both connectivity fixtures; spec= validates
+    attribute names against the real class without autospec's full
+    per-test introspection walk.
+    """
     with patch(
         "custom_components.azimut_energy.mqtt_client.AzimutMQTTClient",
-        autospec=True,
+        spec=AzimutMQTTClient,
     ) as mock_client_class:
         mock_client = mock_client_class.return_value
-        mock_client.connect = AsyncMock(return_value=True)
-        mock_client.disconnect = AsyncMock()
-        mock_client.listen = AsyncMock()
-        mock_client.listen_with_reconnect = AsyncMock()
-        mock_client.is_connected = True
-        mock_client.set_discovery_callback = MagicMock()
-        mock_client.set_state_callback = MagicMock()
-        mock_client.set_connection_callback = MagicMock()
-        # Statistics properties
-        mock_client.connection_count = 1
-        mock_client.reconnect_count = 0
-        mock_client.total_messages_received = 0
-        mock_client.last_message_time = 0.0
-        mock_client.last_connect_time = 1234567890.0
-        mock_client.last_disconnect_time = None
-        mock_client.host = "192.168.1.100"
-        mock_client.port = 8883
-        mock_client.use_tls = True
+        mock_client.configure_mock(
+            connect=AsyncMock(return_value=connect_result),
+            disconnect=AsyncMock(),
+            listen_with_reconnect=AsyncMock(),
+            is_connected=connect_result,
+            set_discovery_callback=MagicMock(),
+            set_state_callback=MagicMock(),
+            set_connection_callback=MagicMock(),
+            **_MQTT_CLIENT_ATTRS,
+        )
+        yield mock_client
+
+
+@pytest.fixture
+def mock_mqtt_client() -> Generator[MagicMock, None, None]:
+    """Mock the AzimutMQTTClient."""
+    with _patch_mqtt_client(connect_result=True) as mock_client:
         yield mock_client
 
 
 @pytest.fixture
 def mock_mqtt_client_cannot_connect() -> Generator[MagicMock, None, None]:
     """Mock the AzimutMQTTClient that cannot connect."""
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.AzimutMQTTClient",
-        autospec=True,
-    ) as mock_client_class:
-        mock_client = mock_client_class.return_value
-        mock_client.connect = AsyncMock(return_value=False)
-        mock_client.disconnect = AsyncMock()
-        mock_client.is_connected = False
+    with _patch_mqtt_client(connect_result=False) as mock_client:
         yield mock_client
 
 
+# Shared entry data; the fixture itself stays function-scoped because tests
+# mutate the entry (runtime_data, update listeners) and must not see state
+# from a previous test
+MOCK_CONFIG_DATA = {
+    CONF_HOST: "192.168.1.100",
+    CONF_SERIAL: "504589",
+}
+
+
 @pytest.fixture
-def mock_config_entry() -> MagicMock:
-    """Create a mock config entry."""
-    entry = MagicMock()
-    entry.entry_id = "test_entry_id"
-    entry.domain = DOMAIN
-    entry.data = {
-        CONF_HOST: "192.168.1.100",
-        CONF_SERIAL: "504589",
-    }
-    entry.options = {}
-    entry.unique_id = "azimut_energy_504589"
-    entry.title = "Azimut Battery 504589"
-    return entry
+def mock_config_entry() -> SimpleNamespace:
+    """Create a mock config entry.
+
+    A plain namespace is enough here: the entry is only read for data and
+    assigned runtime_data, and SimpleNamespace skips MagicMock's per-access
+    child-mock bookkeeping. The few entry methods setup calls are no-op
+    lambdas.
+    """
+    return SimpleNamespace(
+        entry_id="test_entry_id",
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        options={},
+        unique_id="azimut_energy_504589",
+        title="Azimut Battery 504589",
+        version=1,
+        source=config_entries.SOURCE_USER,
+        runtime_data=None,
+        # Read by the entity registry when entities register against the entry
+        pref_disable_new_entities=False,
+        add_update_listener=lambda listener: listener,
+        async_on_unload=lambda func: func,
+        add_to_hass=lambda hass: None,
+    )
+
+
+@pytest.fixture
+def make_config_entry(hass: HomeAssistant):
+    """Return a factory for the standard registered config entry.
+
+    The flow tests build the same entry over and over; the factory keeps
+    the field soup in one place and registers the entry with hass.
+    """
+
+    def _make(host: str = "192.168.1.100") -> MockConfigEntry:
+        entry = MockConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="Azimut Battery 504589",
+            data={
+                CONF_HOST: host,
+                CONF_SERIAL: "504589",
+            },
+            source=config_entries.SOURCE_USER,
+            unique_id="azimut_energy_504589",
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _make
+
+
+@pytest.fixture
+def patched_mqtt_client() -> Generator[MagicMock, None, None]:
+    """Patch the config flow's AzimutMQTTClient and yield the instance mock.
+
+    Patches the attribute on the already-imported module object, so tests
+    skip mock.patch's dotted-path target resolution; connect defaults to
+    success and tests override return_value/side_effect as needed.
+    """
+    from custom_components.azimut_energy import config_flow
+
+    mock_client_class = MagicMock()
+    mock_client = mock_client_class.return_value
+    mock_client.connect = AsyncMock(return_value=True)
+    mock_client.disconnect = AsyncMock()
+    with patch.object(config_flow, "AzimutMQTTClient", mock_client_class):
+        yield mock_client
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,21 +14,34 @@ from custom_components.azimut_energy.binary_sensor import AzimutConnectionSensor
 from custom_components.azimut_energy.const import CONF_SERIAL, DOMAIN
 
 
-@pytest.fixture
-def mock_coordinator() -> MagicMock:
-    """Mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.is_connected = True
-    coordinator.set_connection_callback = MagicMock()
+@pytest.fixture(autouse=True, scope="module")
+def _stub_write_ha_state() -> None:
+    """Stub state writes for the whole module.
+
+    No test here asserts on the write itself, so one class-level patch
+    replaces the per-test patch.object blocks around each state change.
+    """
+    with patch.object(AzimutConnectionSensor, "async_write_ha_state", MagicMock()):
+        yield
 
-    # Mock mqtt_client
-    mqtt_client = MagicMock()
-    mqtt_client.host = "192.168.1.100"
-    mqtt_client.port = 8883
-    mqtt_client.use_tls = True
-    coordinator.mqtt_client = mqtt_client
 
-    return coordinator
+@pytest.fixture
+def mock_coordinator() -> SimpleNamespace:
+    """Mock coordinator.
+
+    The connection sensor only reads attributes off the coordinator, so a
+    SimpleNamespace data holder beats a MagicMock; set_connection_callback
+    just hands back a no-op unsubscribe like the real coordinator does.
+    """
+    return SimpleNamespace(
+        is_connected=True,
+        set_connection_callback=lambda callback_func: lambda: None,
+        mqtt_client=SimpleNamespace(
+            host="192.168.1.100",
+            port=8883,
+            use_tls=True,
+        ),
+    )
 
 
 async def test_binary_sensor_setup(
@@ -41,7 +55,7 @@ async def test_binary_sensor_setup(
     entry.data = {CONF_SERIAL: "ABC123"}
     entry.entry_id = "test_entry"
 
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
+    entry.runtime_data = mock_coordinator
 
     add_entities_mock = MagicMock()
     await async_setup_entry(hass, entry, add_entities_mock)
@@ -108,15 +122,11 @@ async def test_connection_sensor_state_change(
     assert sensor.is_on is True
 
     # Simulate disconnection
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor._handle_connection_change(False)
-
+    sensor._handle_connection_change(False)
     assert sensor.is_on is False
 
     # Simulate reconnection
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor._handle_connection_change(True)
-
+    sensor._handle_connection_change(True)
     assert sensor.is_on is True
 
 
@@ -149,7 +159,5 @@ async def test_connection_sensor_always_available(
     sensor.hass = hass
 
     # Should be available even when disconnected
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor._handle_connection_change(False)
-
+    sensor._handle_connection_change(False)
     assert sensor.available is True
@@ -2,68 +2,102 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
 from custom_components.azimut_energy.const import DOMAIN
+from custom_components.azimut_energy.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+def _mock_coordinator(connected: bool) -> SimpleNamespace:
+    """Build a coordinator stand-in holding what diagnostics reads.
+
+    Diagnostics only ever reads attributes, so a SimpleNamespace beats
+    MagicMock's child-mock machinery and keeps the statistics values real.
+    """
+    return SimpleNamespace(
+        is_connected=connected,
+        mqtt_client=SimpleNamespace(
+            connection_count=1,
+            reconnect_count=0,
+            total_messages_received=0,
+            last_message_time=0.0,
+            last_connect_time=None,
+            last_disconnect_time=None,
+        ),
+    )
 
 
-async def test_diagnostics(hass: HomeAssistant, mock_config_entry: MagicMock) -> None:
-    """Test diagnostics."""
-    from homeassistant.helpers import entity_registry as er
+@pytest.fixture
+def voltage_entity(hass: HomeAssistant, mock_config_entry: MagicMock):
+    """Register the battery-voltage test entity once for the entity tests.
 
-    from custom_components.azimut_energy.diagnostics import (
-        async_get_config_entry_diagnostics,
+    Both entity-inspecting tests need the identical registry entry; only
+    the state they set on it differs.
+    """
+    mock_config_entry.add_to_hass(hass)
+    return er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "504589_battery_voltage",
+        config_entry=mock_config_entry,
+        original_name="Battery Voltage",
     )
 
+
+async def test_diagnostics(hass: HomeAssistant, mock_config_entry: MagicMock) -> None:
+    """Test diagnostics."""
     # Initialize entity registry
     er.async_get(hass)
 
     mock_config_entry.add_to_hass(hass)
 
-    # Set up coordinator in hass.data
-    mock_coordinator = MagicMock()
-    mock_coordinator.is_connected = True
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][mock_config_entry.entry_id] = mock_coordinator
+    # Set up coordinator on the entry
+    mock_config_entry.runtime_data = _mock_coordinator(connected=True)
 
     # Get diagnostics
     diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
 
-    # Verify diagnostics structure
-    assert "config_entry" in diagnostics
-    assert diagnostics["config_entry"]["entry_id"] == mock_config_entry.entry_id
-    assert diagnostics["config_entry"]["domain"] == DOMAIN
-    assert diagnostics["config_entry"]["title"] == "Azimut Battery 504589"
-
-    assert "connection" in diagnostics
-    assert diagnostics["connection"]["host"] == "192.168.1.100"
-    assert diagnostics["connection"]["port"] == 8883
-    assert diagnostics["connection"]["serial"] == "504589"
-    assert diagnostics["connection"]["connected"] is True
+    # Verify diagnostics structure: one dict comparison per section gives a
+    # full diff on failure instead of stopping at the first mismatched key
+    expected = {
+        "config_entry": {
+            "entry_id": mock_config_entry.entry_id,
+            "domain": DOMAIN,
+            "title": "Azimut Battery 504589",
+        },
+        "connection": {
+            "host": "192.168.1.100",
+            "port": 8883,
+            "serial": "504589",
+            "connected": True,
+        },
+        "sensors": {
+            "count": 0,
+            "entities": [],
+        },
+    }
+    for section, fields in expected.items():
+        assert {key: diagnostics[section][key] for key in fields} == fields
 
-    assert "mqtt_topics" in diagnostics
     assert "homeassistant/sensor/azen_504589" in diagnostics["mqtt_topics"]["discovery"]
     assert "azen/504589/sensor" in diagnostics["mqtt_topics"]["state"]
 
-    assert "sensors" in diagnostics
-    assert diagnostics["sensors"]["count"] == 0
-    assert diagnostics["sensors"]["entities"] == []
-
 
 async def test_diagnostics_no_coordinator(
     hass: HomeAssistant, mock_config_entry: MagicMock
 ) -> None:
     """Test diagnostics when coordinator is not available."""
-    from custom_components.azimut_energy.diagnostics import (
-        async_get_config_entry_diagnostics,
-    )
-
     mock_config_entry.add_to_hass(hass)
 
     # Don't set up coordinator - simulate it not being available
-    hass.data.setdefault(DOMAIN, {})
+    mock_config_entry.runtime_data = None
 
     # Get diagnostics
     diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
@@ -73,85 +107,38 @@ async def test_diagnostics_no_coordinator(
     assert diagnostics["sensors"]["count"] == 0
 
 
-async def test_diagnostics_with_entities(
-    hass: HomeAssistant, mock_config_entry: MagicMock
-) -> None:
-    """Test diagnostics with registered entities."""
-    from homeassistant.helpers import entity_registry as er
-
-    from custom_components.azimut_energy.diagnostics import (
-        async_get_config_entry_diagnostics,
-    )
-
-    mock_config_entry.add_to_hass(hass)
-
-    # Set up coordinator
-    mock_coordinator = MagicMock()
-    mock_coordinator.is_connected = True
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][mock_config_entry.entry_id] = mock_coordinator
-
-    # Register a test entity
-    entity_registry = er.async_get(hass)
-    entity = entity_registry.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        "504589_battery_voltage",
-        config_entry=mock_config_entry,
-        original_name="Battery Voltage",
+@pytest.fixture
+async def diag(
+    hass: HomeAssistant,
+    mock_config_entry: MagicMock,
+    voltage_entity,
+    request: pytest.FixtureRequest,
+) -> dict:
+    """Run diagnostics once for the parametrized entity state."""
+    mock_config_entry.runtime_data = _mock_coordinator(
+        connected=request.param != "unavailable"
     )
 
-    # Set state for the entity using the actual entity_id
-    hass.states.async_set(entity.entity_id, "48.5", {"unit": "V"})
-
-    # Get diagnostics
-    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
-
-    # Verify sensor information is included
-    assert diagnostics["sensors"]["count"] == 1
-    assert len(diagnostics["sensors"]["entities"]) == 1
-
-    sensor = diagnostics["sensors"]["entities"][0]
-    assert sensor["unique_id"] == "504589_battery_voltage"
-    assert sensor["state"] == "48.5"
-    assert sensor["available"] is True
+    hass.states.async_set(voltage_entity.entity_id, request.param)
+    return await async_get_config_entry_diagnostics(hass, mock_config_entry)
 
 
-async def test_diagnostics_with_unavailable_entity(
-    hass: HomeAssistant, mock_config_entry: MagicMock
+@pytest.mark.parametrize(
+    ("diag", "state", "available"),
+    [
+        ("48.5", "48.5", True),
+        ("unavailable", "unavailable", False),
+    ],
+    indirect=["diag"],
+)
+async def test_diagnostics_entity_state(
+    diag: dict, state: str, available: bool
 ) -> None:
-    """Test diagnostics with an unavailable entity."""
-    from homeassistant.helpers import entity_registry as er
-
-    from custom_components.azimut_energy.diagnostics import (
-        async_get_config_entry_diagnostics,
-    )
-
-    mock_config_entry.add_to_hass(hass)
+    """Test diagnostics reporting for an available and an unavailable entity."""
+    assert diag["sensors"]["count"] == 1
+    assert len(diag["sensors"]["entities"]) == 1
 
-    # Set up coordinator
-    mock_coordinator = MagicMock()
-    mock_coordinator.is_connected = False
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][mock_config_entry.entry_id] = mock_coordinator
-
-    # Register a test entity
-    entity_registry = er.async_get(hass)
-    entity = entity_registry.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        "504589_battery_voltage",
-        config_entry=mock_config_entry,
-        original_name="Battery Voltage",
-    )
-
-    # Set state as unavailable using the actual entity_id
-    hass.states.async_set(entity.entity_id, "unavailable")
-
-    # Get diagnostics
-    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
-
-    # Verify sensor is marked as unavailable
-    sensor = diagnostics["sensors"]["entities"][0]
-    assert sensor["state"] == "unavailable"
-    assert sensor["available"] is False
+    sensor = diag["sensors"]["entities"][0]
+    assert sensor["unique_id"] == "504589_battery_voltage"
+    assert sensor["state"] == state
+    assert sensor["available"] is available
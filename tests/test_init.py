@@ -10,46 +10,72 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.azimut_energy.const import CONF_SERIAL, DOMAIN  # noqa: I001
+from custom_components.azimut_energy import (
+    AzimutMQTTCoordinator,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.azimut_energy.const import CONF_SERIAL  # noqa: I001
 
 
-async def test_setup_entry_success(
+@pytest.fixture
+async def setup_coordinator(
     hass: HomeAssistant,
     mock_mqtt_client: MagicMock,
     mock_config_entry: MagicMock,
-) -> None:
-    """Test successful setup of config entry."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client,
-    ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        # Mock the platform setup
-        with patch.object(
+) -> AzimutMQTTCoordinator:
+    """Set up the config entry once and return its coordinator.
+
+    The four coordinator tests all need the same setup-with-patches
+    preamble; running it here keeps one async_setup_entry call per test
+    instead of repeating the patch plumbing inline.
+    """
+    with (
+        patch(
+            "custom_components.azimut_energy.AzimutMQTTClient",
+            return_value=mock_mqtt_client,
+        ),
+        patch.object(
             hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
-        ):
-            result = await async_setup_entry(hass, mock_config_entry)
+        ),
+    ):
+        await async_setup_entry(hass, mock_config_entry)
 
-    assert result is True
-    assert DOMAIN in hass.data
-    assert mock_config_entry.entry_id in hass.data[DOMAIN]
+    return mock_config_entry.runtime_data
 
 
-async def test_setup_entry_connection_failure(
+@pytest.mark.parametrize(
+    ("client_fixture", "raises"),
+    [
+        ("mock_mqtt_client", None),
+        ("mock_mqtt_client_cannot_connect", ConfigEntryNotReady),
+    ],
+)
+async def test_setup_entry_result(
     hass: HomeAssistant,
-    mock_mqtt_client_cannot_connect: MagicMock,
     mock_config_entry: MagicMock,
+    request: pytest.FixtureRequest,
+    client_fixture: str,
+    raises: type[Exception] | None,
 ) -> None:
-    """Test setup failure when MQTT connection fails."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client_cannot_connect,
+    """Test entry setup for a connecting and a non-connecting client."""
+    client = request.getfixturevalue(client_fixture)
+    with (
+        patch(
+            "custom_components.azimut_energy.AzimutMQTTClient",
+            return_value=client,
+        ),
+        # Mock the platform setup
+        patch.object(
+            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+        ),
     ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        with pytest.raises(ConfigEntryNotReady):
-            await async_setup_entry(hass, mock_config_entry)
+        if raises is None:
+            assert await async_setup_entry(hass, mock_config_entry) is True
+            assert mock_config_entry.runtime_data is not None
+        else:
+            with pytest.raises(raises):
+                await async_setup_entry(hass, mock_config_entry)
 
 
 async def test_unload_entry(
@@ -62,11 +88,6 @@ async def test_unload_entry(
         "custom_components.azimut_energy.AzimutMQTTClient",
         return_value=mock_mqtt_client,
     ):
-        from custom_components.azimut_energy import (
-            async_setup_entry,
-            async_unload_entry,
-        )
-
         # Setup first
         with patch.object(
             hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
@@ -83,113 +104,78 @@ async def test_unload_entry(
             result = await async_unload_entry(hass, mock_config_entry)
 
     assert result is True
-    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+    mock_mqtt_client.disconnect.assert_awaited()
 
 
 async def test_coordinator_callbacks(
-    hass: HomeAssistant,
+    setup_coordinator: AzimutMQTTCoordinator,
     mock_mqtt_client: MagicMock,
-    mock_config_entry: MagicMock,
 ) -> None:
     """Test coordinator callback setup."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client,
-    ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        with patch.object(
-            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
-        ):
-            await async_setup_entry(hass, mock_config_entry)
-
-    # Verify MQTT client callbacks were set
-    mock_mqtt_client.set_discovery_callback.assert_called_once()
-    mock_mqtt_client.set_state_callback.assert_called_once()
-    mock_mqtt_client.set_connection_callback.assert_called_once()
+    # Discovery/state callbacks registered on the coordinator are handed
+    # straight to the MQTT client (no wrapper indirection)
+    coordinator = setup_coordinator
+    discovery_cb = lambda payload: None  # noqa: E731
+    state_cb = lambda topic, value: None  # noqa: E731
+    coordinator.set_discovery_callback(discovery_cb)
+    coordinator.set_state_callback(state_cb)
+
+    # Last registration wins: the platform callback replaces the startup
+    # buffering handler on the client
+    assert mock_mqtt_client.set_discovery_callback.call_args[0][0] is discovery_cb
+    assert mock_mqtt_client.set_state_callback.call_args[0][0] is state_cb
+
+    # Connection events fan out through the coordinator to many subscribers
+    received: list[bool] = []
+    unsub = coordinator.set_connection_callback(received.append)
+    dispatch = mock_mqtt_client.set_connection_callback.call_args[0][0]
+    dispatch(True)
+    assert received == [True]
+
+    unsub()
+    dispatch(False)
+    assert received == [True]
 
 
 async def test_coordinator_connection_state(
-    hass: HomeAssistant,
-    mock_mqtt_client: MagicMock,
-    mock_config_entry: MagicMock,
+    setup_coordinator: AzimutMQTTCoordinator,
 ) -> None:
     """Test coordinator connection state property."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client,
-    ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        with patch.object(
-            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
-        ):
-            await async_setup_entry(hass, mock_config_entry)
-
-        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
-        assert coordinator.is_connected is True
+    assert setup_coordinator.is_connected is True
 
 
 async def test_coordinator_discovery_routing(
-    hass: HomeAssistant,
+    setup_coordinator: AzimutMQTTCoordinator,
     mock_mqtt_client: MagicMock,
-    mock_config_entry: MagicMock,
 ) -> None:
     """Test coordinator routes discovery messages."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client,
-    ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        with patch.object(
-            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
-        ):
-            await async_setup_entry(hass, mock_config_entry)
+    # Set up a mock callback
+    received = []
+    setup_coordinator.set_discovery_callback(lambda payload: received.append(payload))
 
-        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    # Simulate discovery message from MQTT client
+    # Get the callback that was registered with the MQTT client
+    discovery_cb = mock_mqtt_client.set_discovery_callback.call_args[0][0]
+    discovery_cb({"unique_id": "test", "name": "Test"})
 
-        # Set up a mock callback
-        received = []
-        coordinator.set_discovery_callback(lambda payload: received.append(payload))
-
-        # Simulate discovery message from MQTT client
-        # Get the callback that was registered with the MQTT client
-        discovery_cb = mock_mqtt_client.set_discovery_callback.call_args[0][0]
-        discovery_cb({"unique_id": "test", "name": "Test"})
-
-        assert len(received) == 1
-        assert received[0]["unique_id"] == "test"
+    assert len(received) == 1
+    assert received[0]["unique_id"] == "test"
 
 
 async def test_coordinator_state_routing(
-    hass: HomeAssistant,
+    setup_coordinator: AzimutMQTTCoordinator,
     mock_mqtt_client: MagicMock,
-    mock_config_entry: MagicMock,
 ) -> None:
     """Test coordinator routes state messages."""
-    with patch(
-        "custom_components.azimut_energy.AzimutMQTTClient",
-        return_value=mock_mqtt_client,
-    ):
-        from custom_components.azimut_energy import async_setup_entry
-
-        with patch.object(
-            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
-        ):
-            await async_setup_entry(hass, mock_config_entry)
-
-        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
-
-        # Set up a mock callback
-        received = []
-        coordinator.set_state_callback(
-            lambda topic, value: received.append((topic, value))
-        )
-
-        # Simulate state message from MQTT client
-        state_cb = mock_mqtt_client.set_state_callback.call_args[0][0]
-        state_cb("test/topic", 42.0)
-
-        assert len(received) == 1
-        assert received[0] == ("test/topic", 42.0)
+    # Set up a mock callback
+    received = []
+    setup_coordinator.set_state_callback(
+        lambda topic, value: received.append((topic, value))
+    )
+
+    # Simulate state message from MQTT client
+    state_cb = mock_mqtt_client.set_state_callback.call_args[0][0]
+    state_cb("test/topic", 42.0)
+
+    assert len(received) == 1
+    assert received[0] == ("test/topic", 42.0)
@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.azimut_energy.mqtt_client import AzimutMQTTClient
-
-
-@pytest.fixture
+from custom_components.azimut_energy import mqtt_client as mqtt_client_module
+from custom_components.azimut_energy.mqtt_client import (
+    INITIAL_RECONNECT_DELAY,
+    AzimutMQTTClient,
+)
+
+# Payloads are constants; serialize them once at module load instead of
+# per test run
+_DISCOVERY_PAYLOAD = json.dumps(
+    {
+        "unique_id": "azen_ABC123_battery_soc",
+        "name": "Battery SOC",
+        "state_topic": "azen/ABC123/sensor/battery_soc/state",
+    }
+)
+_DOUBLE_ENCODED_PAYLOAD = json.dumps(
+    json.dumps({"unique_id": "test", "name": "Test Sensor"})
+)
+
+
+@pytest.fixture(scope="module")
 def mqtt_client() -> AzimutMQTTClient:
-    """Create a test MQTT client."""
+    """Create a test MQTT client, shared across the module."""
     return AzimutMQTTClient(
         host="192.168.1.100",
         port=8883,
@@ -21,7 +40,58 @@ def mqtt_client() -> AzimutMQTTClient:
     )
 
 
-async def test_client_initialization(mqtt_client: AzimutMQTTClient) -> None:
+@pytest.fixture(autouse=True)
+def _reset_client_state(
+    mqtt_client: AzimutMQTTClient,
+) -> Generator[None, None, None]:
+    """Return the shared client to its freshly-constructed state.
+
+    Sharing one client across the module skips repeated constructor work;
+    everything a test can mutate is rolled back here so tests stay
+    order-independent.
+    """
+    yield
+    mqtt_client._client = None
+    mqtt_client._running = False
+    # A fresh Event, not clear(): waiting binds the event to the test's
+    # loop, and each test runs in its own loop
+    mqtt_client._stop_event = asyncio.Event()
+    mqtt_client._connected = False
+    mqtt_client._reconnect_delay = INITIAL_RECONNECT_DELAY
+    mqtt_client._last_message_time = 0.0
+    mqtt_client._connection_count = 0
+    mqtt_client._reconnect_count = 0
+    mqtt_client._last_connect_time = None
+    mqtt_client._last_disconnect_time = None
+    mqtt_client._total_messages_received = 0
+    mqtt_client._discovery_callback = None
+    mqtt_client._state_callback = None
+    mqtt_client._connection_callback = None
+    mqtt_client._pending_states.clear()
+    if mqtt_client._flush_handle is not None:
+        mqtt_client._flush_handle.cancel()
+        mqtt_client._flush_handle = None
+
+
+@pytest.fixture
+def mock_aiomqtt(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace aiomqtt.Client with a pre-built connected mock.
+
+    monkeypatch.setattr on the already-imported module skips patch()'s
+    dotted-path resolution; tests override __aenter__ side effects to
+    model connection failures.
+    """
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    client.subscribe = AsyncMock()
+    monkeypatch.setattr(
+        mqtt_client_module.aiomqtt, "Client", MagicMock(return_value=client)
+    )
+    return client
+
+
+def test_client_initialization(mqtt_client: AzimutMQTTClient) -> None:
     """Test client initialization."""
     assert mqtt_client.host == "192.168.1.100"
     assert mqtt_client.port == 8883
@@ -30,36 +100,25 @@ async def test_client_initialization(mqtt_client: AzimutMQTTClient) -> None:
     assert not mqtt_client.is_connected
 
 
-async def test_connect_success(mqtt_client: AzimutMQTTClient) -> None:
+async def test_connect_success(
+    mqtt_client: AzimutMQTTClient, mock_aiomqtt: MagicMock
+) -> None:
     """Test successful connection validation."""
-    mock_aiomqtt_client = MagicMock()
-    mock_aiomqtt_client.__aenter__ = AsyncMock(return_value=mock_aiomqtt_client)
-    mock_aiomqtt_client.__aexit__ = AsyncMock(return_value=None)
-    mock_aiomqtt_client.subscribe = AsyncMock()
-
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.aiomqtt.Client"
-    ) as mock_client:
-        mock_client.return_value = mock_aiomqtt_client
-
-        result = await mqtt_client.connect()
+    result = await mqtt_client.connect()
 
     assert result is True
     # connect() is for validation only, it disconnects after
     assert not mqtt_client.is_connected
-    assert mock_aiomqtt_client.subscribe.call_count == 2  # Discovery + state topics
+    assert mock_aiomqtt.subscribe.call_count == 2  # Discovery + state topics
 
 
-async def test_connect_failure(mqtt_client: AzimutMQTTClient) -> None:
+async def test_connect_failure(
+    mqtt_client: AzimutMQTTClient, mock_aiomqtt: MagicMock
+) -> None:
     """Test connection failure."""
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.aiomqtt.Client"
-    ) as mock_client:
-        mock_client.return_value.__aenter__ = AsyncMock(
-            side_effect=Exception("Connection refused")
-        )
+    mock_aiomqtt.__aenter__.side_effect = Exception("Connection refused")
 
-        result = await mqtt_client.connect()
+    result = await mqtt_client.connect()
 
     assert result is False
     assert not mqtt_client.is_connected
@@ -87,15 +146,7 @@ async def test_discovery_callback(mqtt_client: AzimutMQTTClient) -> None:
     mqtt_client.set_discovery_callback(discovery_callback)
 
     # Simulate discovery message handling
-    discovery_payload = json.dumps(
-        {
-            "unique_id": "azen_ABC123_battery_soc",
-            "name": "Battery SOC",
-            "state_topic": "azen/ABC123/sensor/battery_soc/state",
-        }
-    )
-
-    mqtt_client._handle_discovery_message(discovery_payload)
+    mqtt_client._handle_discovery_message(_DISCOVERY_PAYLOAD)
 
     assert len(received_payloads) == 1
     assert received_payloads[0]["unique_id"] == "azen_ABC123_battery_soc"
@@ -111,10 +162,7 @@ async def test_discovery_double_encoded_json(mqtt_client: AzimutMQTTClient) -> N
     mqtt_client.set_discovery_callback(discovery_callback)
 
     # Double-encoded JSON (string inside JSON)
-    inner_payload = {"unique_id": "test", "name": "Test Sensor"}
-    double_encoded = json.dumps(json.dumps(inner_payload))
-
-    mqtt_client._handle_discovery_message(double_encoded)
+    mqtt_client._handle_discovery_message(_DOUBLE_ENCODED_PAYLOAD)
 
     assert len(received_payloads) == 1
     assert received_payloads[0]["unique_id"] == "test"
@@ -129,8 +177,9 @@ async def test_state_callback(mqtt_client: AzimutMQTTClient) -> None:
 
     mqtt_client.set_state_callback(state_callback)
 
-    # Simulate state message handling
+    # Simulate state message handling; updates are coalesced briefly
     mqtt_client._handle_state_message("azen/ABC123/sensor/battery_soc/state", "85.50")
+    mqtt_client._flush_states()
 
     assert len(received_states) == 1
     assert received_states[0] == ("azen/ABC123/sensor/battery_soc/state", 85.50)
@@ -149,6 +198,7 @@ async def test_state_json_encoded_value(mqtt_client: AzimutMQTTClient) -> None:
     mqtt_client._handle_state_message(
         "azen/ABC123/sensor/grid_power/state", '"1523.45"'
     )
+    mqtt_client._flush_states()
 
     assert len(received_states) == 1
     assert received_states[0][1] == 1523.45
@@ -167,6 +217,7 @@ async def test_state_invalid_value(mqtt_client: AzimutMQTTClient) -> None:
     mqtt_client._handle_state_message(
         "azen/ABC123/sensor/battery_soc/state", "not_a_number"
     )
+    mqtt_client._flush_states()
 
     assert len(received_states) == 0
 
@@ -193,22 +244,29 @@ async def test_connection_callback(mqtt_client: AzimutMQTTClient) -> None:
     assert connection_states == [True, False]  # No change
 
 
-async def test_topic_patterns(mqtt_client: AzimutMQTTClient) -> None:
-    """Test topic pattern matching."""
-    # Discovery topic pattern
-    assert mqtt_client._discovery_pattern.match(
-        "homeassistant/sensor/azen_ABC123/battery_soc/config"
-    )
-    assert not mqtt_client._discovery_pattern.match(
-        "homeassistant/sensor/azen_OTHER/battery_soc/config"
-    )
+def test_topic_patterns(mqtt_client: AzimutMQTTClient) -> None:
+    """Test topic prefix/suffix matching."""
+
+    def is_discovery(topic: str) -> bool:
+        return topic.startswith(mqtt_client._disc_prefix) and topic.endswith(
+            mqtt_client._disc_suffix
+        )
 
-    # State topic pattern
-    assert mqtt_client._state_pattern.match("azen/ABC123/sensor/battery_soc/state")
-    assert not mqtt_client._state_pattern.match("azen/OTHER/sensor/battery_soc/state")
+    def is_state(topic: str) -> bool:
+        return topic.startswith(mqtt_client._state_prefix) and topic.endswith(
+            mqtt_client._state_suffix
+        )
+
+    # Discovery topic
+    assert is_discovery("homeassistant/sensor/azen_ABC123/battery_soc/config")
+    assert not is_discovery("homeassistant/sensor/azen_OTHER/battery_soc/config")
+
+    # State topic
+    assert is_state("azen/ABC123/sensor/battery_soc/state")
+    assert not is_state("azen/OTHER/sensor/battery_soc/state")
 
 
-async def test_tls_context_creation(mqtt_client: AzimutMQTTClient) -> None:
+def test_tls_context_creation(mqtt_client: AzimutMQTTClient) -> None:
     """Test TLS context is created when use_tls is True."""
     tls_context = mqtt_client._create_tls_context()
 
@@ -220,7 +278,7 @@ async def test_tls_context_creation(mqtt_client: AzimutMQTTClient) -> None:
     assert tls_context.check_hostname is False
 
 
-async def test_no_tls_context() -> None:
+def test_no_tls_context() -> None:
     """Test no TLS context when use_tls is False."""
     client = AzimutMQTTClient(
         host="192.168.1.100",
@@ -251,97 +309,66 @@ async def test_disconnect_with_error(mqtt_client: AzimutMQTTClient) -> None:
     assert mqtt_client._client is None
 
 
-async def test_listen_with_reconnect_mqtt_error(mqtt_client: AzimutMQTTClient) -> None:
+async def test_listen_with_reconnect_mqtt_error(
+    mqtt_client: AzimutMQTTClient, mock_aiomqtt: MagicMock
+) -> None:
     """Test listen_with_reconnect handles MQTT errors and reconnects."""
-    import asyncio
-
     import aiomqtt
 
-    mock_aiomqtt_client = MagicMock()
-    mock_aiomqtt_client.__aenter__ = AsyncMock(
-        side_effect=aiomqtt.MqttError("Connection failed")
-    )
-    mock_aiomqtt_client.__aexit__ = AsyncMock()
+    mock_aiomqtt.__aenter__.side_effect = aiomqtt.MqttError("Connection failed")
 
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.aiomqtt.Client"
-    ) as mock_client:
-        mock_client.return_value = mock_aiomqtt_client
+    # Start listening in background
+    task = asyncio.create_task(mqtt_client.listen_with_reconnect())
 
-        # Start listening in background
-        task = asyncio.create_task(mqtt_client.listen_with_reconnect())
+    # Wait a bit for the first connection attempt
+    await asyncio.sleep(0.1)
 
-        # Wait a bit for the first connection attempt
-        await asyncio.sleep(0.1)
-
-        # Stop the client
-        mqtt_client._running = False
+    # Stop the client
+    mqtt_client._running = False
 
-        # Wait for task to complete
-        try:
-            await asyncio.wait_for(task, timeout=1.0)
-        except TimeoutError:
-            task.cancel()
+    # Wait for task to complete
+    try:
+        await asyncio.wait_for(task, timeout=1.0)
+    except TimeoutError:
+        task.cancel()
 
 
-async def test_listen_with_reconnect_cancelled(mqtt_client: AzimutMQTTClient) -> None:
+async def test_listen_with_reconnect_cancelled(
+    mqtt_client: AzimutMQTTClient, mock_aiomqtt: MagicMock
+) -> None:
     """Test listen_with_reconnect handles cancellation."""
-    import asyncio
-
-    mock_aiomqtt_client = MagicMock()
+    # Simulate a cancellation during connection
+    mock_aiomqtt.__aenter__.side_effect = asyncio.CancelledError()
 
-    async def mock_aenter(*args):
-        # Simulate a cancellation during connection
-        raise asyncio.CancelledError()
+    # This should exit cleanly when cancelled
+    try:
+        await mqtt_client.listen_with_reconnect()
+    except asyncio.CancelledError:
+        pass
 
-    mock_aiomqtt_client.__aenter__ = mock_aenter
-    mock_aiomqtt_client.__aexit__ = AsyncMock()
-
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.aiomqtt.Client"
-    ) as mock_client:
-        mock_client.return_value = mock_aiomqtt_client
-
-        # This should exit cleanly when cancelled
-        try:
-            await mqtt_client.listen_with_reconnect()
-        except asyncio.CancelledError:
-            pass
-
-        assert not mqtt_client.is_connected
+    assert not mqtt_client.is_connected
 
 
 async def test_listen_with_reconnect_unexpected_error(
-    mqtt_client: AzimutMQTTClient,
+    mqtt_client: AzimutMQTTClient, mock_aiomqtt: MagicMock
 ) -> None:
     """Test listen_with_reconnect handles unexpected errors."""
-    import asyncio
+    mock_aiomqtt.__aenter__.side_effect = RuntimeError("Unexpected error")
 
-    mock_aiomqtt_client = MagicMock()
-    mock_aiomqtt_client.__aenter__ = AsyncMock(
-        side_effect=RuntimeError("Unexpected error")
-    )
-    mock_aiomqtt_client.__aexit__ = AsyncMock()
+    # Start listening in background
+    task = asyncio.create_task(mqtt_client.listen_with_reconnect())
 
-    with patch(
-        "custom_components.azimut_energy.mqtt_client.aiomqtt.Client"
-    ) as mock_client:
-        mock_client.return_value = mock_aiomqtt_client
+    # Wait a bit for the first connection attempt
+    await asyncio.sleep(0.1)
 
-        # Start listening in background
-        task = asyncio.create_task(mqtt_client.listen_with_reconnect())
+    # Stop the client
+    mqtt_client._running = False
 
-        # Wait a bit for the first connection attempt
-        await asyncio.sleep(0.1)
-
-        # Stop the client
-        mqtt_client._running = False
-
-        # Wait for task to complete
-        try:
-            await asyncio.wait_for(task, timeout=1.0)
-        except TimeoutError:
-            task.cancel()
+    # Wait for task to complete
+    try:
+        await asyncio.wait_for(task, timeout=1.0)
+    except TimeoutError:
+        task.cancel()
 
 
 async def test_message_timeout_handling(mqtt_client: AzimutMQTTClient) -> None:
@@ -358,13 +385,12 @@ async def test_message_timeout_handling(mqtt_client: AzimutMQTTClient) -> None:
 
 async def test_sleep_with_check_early_exit(mqtt_client: AzimutMQTTClient) -> None:
     """Test _sleep_with_check exits early when running is False."""
-    import asyncio
-
     mqtt_client._running = True
 
     async def stop_soon():
         await asyncio.sleep(0.1)
         mqtt_client._running = False
+        mqtt_client._stop_event.set()
 
     # Start stop task
     stop_task = asyncio.create_task(stop_soon())
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from freezegun import freeze_time
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -14,23 +18,61 @@ from custom_components.azimut_energy.const import CONF_SERIAL, DOMAIN  # noqa: I
 from custom_components.azimut_energy.sensor import (  # noqa: I001
     AzimutDiagnosticSensor,
     AzimutSensor,
+    async_setup_entry,
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _silence_write_ha_state() -> None:
+    """Stub state writes for the whole module.
+
+    No test here asserts on the write itself, so one class-level patch per
+    sensor class replaces the per-test patch.object blocks.
+    """
+    with (
+        patch.object(AzimutSensor, "async_write_ha_state", MagicMock()),
+        patch.object(AzimutDiagnosticSensor, "async_write_ha_state", MagicMock()),
+    ):
+        yield
+
+
+class _StubCoordinator:
+    """Minimal coordinator stand-in recording the registered callbacks.
+
+    The sensor platform only calls the three setters and reads
+    mqtt_client counters, so a plain class with real attributes replaces
+    MagicMock's per-access child-mock machinery.
+    """
+
+    def __init__(self) -> None:
+        self.discovery_cb = None
+        self.state_cb = None
+        self.connection_cb = None
+        self.mqtt_client = SimpleNamespace(
+            reconnect_count=0,
+            total_messages_received=0,
+        )
+
+    def set_discovery_callback(self, callback_func) -> None:
+        self.discovery_cb = callback_func
+
+    def set_state_callback(self, callback_func) -> None:
+        self.state_cb = callback_func
+
+    def set_connection_callback(self, callback_func) -> None:
+        self.connection_cb = callback_func
+
+
 @pytest.fixture
-def mock_coordinator() -> MagicMock:
+def mock_coordinator() -> _StubCoordinator:
     """Mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.set_discovery_callback = MagicMock()
-    coordinator.set_state_callback = MagicMock()
-    coordinator.set_connection_callback = MagicMock()
-    return coordinator
+    return _StubCoordinator()
 
 
-@pytest.fixture
-def sample_discovery_payload() -> dict:
-    """Sample discovery payload."""
-    return {
+# Built once; the fixture hands out a read-only view so no test can
+# mutate shared state in place — tests that need a variant .copy() first
+_SAMPLE_DISCOVERY_PAYLOAD = MappingProxyType(
+    {
         "unique_id": "azen_ABC123_battery_soc",
         "name": "Battery State of Charge",
         "state_topic": "azen/ABC123/sensor/battery_soc/state",
@@ -39,54 +81,62 @@ def sample_discovery_payload() -> dict:
         "state_class": "measurement",
         "icon": "mdi:battery",
         "expire_after": 300,
-        "device": {
-            "identifiers": ["azen_ABC123"],
-            "name": "Azen ABC123",
-            "manufacturer": "Azimut",
-            "model": "Azen Energy System",
-            "sw_version": "1.0.0",
-        },
+        "device": MappingProxyType(
+            {
+                "identifiers": ["azen_ABC123"],
+                "name": "Azen ABC123",
+                "manufacturer": "Azimut",
+                "model": "Azen Energy System",
+                "sw_version": "1.0.0",
+            }
+        ),
     }
+)
 
 
-async def test_sensor_creation_from_discovery(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
-) -> None:
-    """Test sensor creation from discovery payload."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
-
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    # Add mqtt_client to coordinator
-    mqtt_client = MagicMock()
-    mqtt_client.reconnect_count = 0
-    mqtt_client.total_messages_received = 0
-    mock_coordinator.mqtt_client = mqtt_client
+@pytest.fixture(scope="session")
+def sample_discovery_payload() -> MappingProxyType:
+    """Sample discovery payload."""
+    return _SAMPLE_DISCOVERY_PAYLOAD
 
-    # Capture the callbacks
-    callbacks = {}
 
-    def capture_discovery_cb(cb):
-        callbacks["discovery"] = cb
+@pytest.fixture
+async def setup_sensor_platform(
+    hass: HomeAssistant,
+    mock_coordinator: _StubCoordinator,
+) -> tuple[dict, MagicMock]:
+    """Set up the sensor platform once and capture its callbacks.
+
+    The discovery-driven tests all repeated the same entry/callback
+    capture preamble; they now receive the captured callbacks and the
+    add_entities mock from here.
+    """
+    entry = SimpleNamespace(
+        data={CONF_SERIAL: "ABC123"},
+        entry_id="test_entry",
+        runtime_data=mock_coordinator,
+        # The platform registers its expiration sweep here; tests rely on
+        # the interval's cancel_on_shutdown instead of running unload hooks
+        async_on_unload=lambda func: func,
+    )
 
-    def capture_state_cb(cb):
-        callbacks["state"] = cb
+    add_entities_mock = MagicMock()
+    await async_setup_entry(hass, entry, add_entities_mock)
 
-    def capture_connection_cb(cb):
-        callbacks["connection"] = cb
+    callbacks = {
+        "discovery": mock_coordinator.discovery_cb,
+        "state": mock_coordinator.state_cb,
+        "connection": mock_coordinator.connection_cb,
+    }
+    return callbacks, add_entities_mock
 
-    mock_coordinator.set_discovery_callback.side_effect = capture_discovery_cb
-    mock_coordinator.set_state_callback.side_effect = capture_state_cb
-    mock_coordinator.set_connection_callback.side_effect = capture_connection_cb
 
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
+async def test_sensor_creation_from_discovery(
+    setup_sensor_platform: tuple[dict, MagicMock],
+    sample_discovery_payload: MappingProxyType,
+) -> None:
+    """Test sensor creation from discovery payload."""
+    callbacks, add_entities_mock = setup_sensor_platform
 
     # Simulate discovery message
     callbacks["discovery"](sample_discovery_payload)
@@ -108,10 +158,9 @@ async def test_sensor_creation_from_discovery(
     assert sensor.state_topic == "azen/ABC123/sensor/battery_soc/state"
 
 
-async def test_sensor_state_update(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+def test_sensor_state_update(
+    mock_coordinator: _StubCoordinator,
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test sensor state update."""
     sensor = AzimutSensor(
@@ -119,103 +168,67 @@ async def test_sensor_state_update(
         payload=sample_discovery_payload,
         serial="ABC123",
     )
-    sensor.hass = hass
 
     # Initial state should be None and unavailable
     assert sensor.native_value is None
     assert not sensor.available
 
     # Update value
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor.update_value(85.5)
+    sensor.update_value(85.5)
 
     # Verify state
     assert sensor.native_value == 85.5
     assert sensor.available
 
 
-async def test_sensor_duplicate_discovery(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+@pytest.mark.parametrize(
+    ("payload_override", "fire_count", "expected_add_calls"),
+    [
+        # Duplicate payloads add the sensor once (second call is ignored);
+        # the first add_entities call is always the diagnostic sensors
+        (None, 2, 2),
+        # A payload without unique_id never creates a sensor
+        ({"name": "Test", "state_topic": "test"}, 1, 1),
+    ],
+)
+async def test_sensor_discovery_payload_handling(
+    setup_sensor_platform: tuple[dict, MagicMock],
+    sample_discovery_payload: MappingProxyType,
+    payload_override: dict | None,
+    fire_count: int,
+    expected_add_calls: int,
 ) -> None:
-    """Test that duplicate discovery messages don't create duplicate sensors."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
+    """Test duplicate and invalid discovery payloads don't add sensors."""
+    callbacks, add_entities_mock = setup_sensor_platform
+    payload = payload_override or sample_discovery_payload
 
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
+    for _ in range(fire_count):
+        callbacks["discovery"](payload)
 
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    # Add mqtt_client to coordinator
-    mqtt_client = MagicMock()
-    mqtt_client.reconnect_count = 0
-    mqtt_client.total_messages_received = 0
-    mock_coordinator.mqtt_client = mqtt_client
-
-    callbacks = {}
-    mock_coordinator.set_discovery_callback.side_effect = lambda cb: callbacks.update(
-        {"discovery": cb}
-    )
-    mock_coordinator.set_state_callback.side_effect = lambda cb: None
-    mock_coordinator.set_connection_callback.side_effect = lambda cb: None
-
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
-
-    # Call discovery callback twice with same payload
-    callbacks["discovery"](sample_discovery_payload)
-    callbacks["discovery"](sample_discovery_payload)
-
-    # Should only create one discovered sensor (2 calls total: 1 for diagnostic, 1 for discovered)
-    assert add_entities_mock.call_count == 2
+    assert add_entities_mock.call_count == expected_add_calls
 
 
 async def test_sensor_state_routing(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+    setup_sensor_platform: tuple[dict, MagicMock],
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test state updates are routed to correct sensor."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
-
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    callbacks = {}
-    mock_coordinator.set_discovery_callback.side_effect = lambda cb: callbacks.update(
-        {"discovery": cb}
-    )
-    mock_coordinator.set_state_callback.side_effect = lambda cb: callbacks.update(
-        {"state": cb}
-    )
-    mock_coordinator.set_connection_callback.side_effect = lambda cb: None
-
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
+    callbacks, add_entities_mock = setup_sensor_platform
 
     # Create sensor via discovery
     callbacks["discovery"](sample_discovery_payload)
 
     sensor = add_entities_mock.call_args[0][0][0]
-    sensor.hass = hass
 
-    # Mock async_write_ha_state
-    with patch.object(sensor, "async_write_ha_state"):
-        # Send state update
-        callbacks["state"]("azen/ABC123/sensor/battery_soc/state", 92.0)
+    # Send state update
+    callbacks["state"]("azen/ABC123/sensor/battery_soc/state", 92.0)
 
     assert sensor.native_value == 92.0
 
 
-async def test_sensor_connection_availability(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+def test_sensor_connection_availability(
+    mock_coordinator: _StubCoordinator,
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test sensor availability based on connection state."""
     sensor = AzimutSensor(
@@ -223,23 +236,19 @@ async def test_sensor_connection_availability(
         payload=sample_discovery_payload,
         serial="ABC123",
     )
-    sensor.hass = hass
 
     # Set sensor as available
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor.update_value(50.0)
+    sensor.update_value(50.0)
     assert sensor.available
 
     # Simulate connection loss
-    with patch.object(sensor, "async_write_ha_state"):
-        sensor.set_connection_available(False)
+    sensor.set_connection_available(False)
     assert not sensor.available
 
 
-async def test_sensor_expiration(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+def test_sensor_expiration(
+    mock_coordinator: _StubCoordinator,
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test sensor expiration after no updates."""
     sensor = AzimutSensor(
@@ -247,127 +256,101 @@ async def test_sensor_expiration(
         payload=sample_discovery_payload,
         serial="ABC123",
     )
-    sensor.hass = hass
     sensor._mqtt_connected = True
 
-    # Set initial value
-    with patch.object(sensor, "async_write_ha_state"):
+    # Frozen clock keeps the 301s jump deterministic instead of doing
+    # arithmetic against the real utcnow
+    with freeze_time("2024-01-01 00:00:00+00:00") as frozen:
+        # Set initial value
         sensor.update_value(1000.0)
-    assert sensor.available
+        assert sensor.available
 
-    # Simulate time passing beyond expiration (300 seconds)
-    sensor._last_update = dt_util.utcnow() - timedelta(seconds=301)
-
-    with patch.object(sensor, "async_write_ha_state"):
+        # Jump past the 300 second expiration window
+        frozen.tick(timedelta(seconds=301))
         sensor._check_expiration(dt_util.utcnow())
 
     # Sensor should be unavailable
     assert not sensor.available
 
 
-async def test_sensor_device_class_mapping(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-) -> None:
-    """Test device class string to enum mapping."""
-    from homeassistant.components.sensor import SensorDeviceClass
-
-    payload = {
-        "unique_id": "test_power",
-        "name": "Test Power",
-        "state_topic": "test/state",
-        "device_class": "power",
-        "device": {"identifiers": ["test"]},
-    }
-
-    sensor = AzimutSensor(
-        coordinator=mock_coordinator,
-        payload=payload,
-        serial="TEST",
-    )
-
-    assert sensor.device_class == SensorDeviceClass.POWER
-
-
-async def test_sensor_state_class_mapping(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-) -> None:
-    """Test state class string to enum mapping."""
-    from homeassistant.components.sensor import SensorStateClass
-
-    payload = {
-        "unique_id": "test_energy",
-        "name": "Test Energy",
-        "state_topic": "test/state",
-        "state_class": "total_increasing",
-        "device": {"identifiers": ["test"]},
-    }
-
-    sensor = AzimutSensor(
-        coordinator=mock_coordinator,
-        payload=payload,
-        serial="TEST",
-    )
-
-    assert sensor.state_class == SensorStateClass.TOTAL_INCREASING
-
-
-async def test_sensor_missing_unique_id(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
+@pytest.mark.parametrize(
+    ("payload_overrides", "serial", "attr", "expected"),
+    [
+        ({"device_class": "power"}, "TEST", "device_class", SensorDeviceClass.POWER),
+        (
+            {"state_class": "total_increasing"},
+            "TEST",
+            "state_class",
+            SensorStateClass.TOTAL_INCREASING,
+        ),
+        (
+            {"entity_category": "diagnostic", "unique_id": "azen_ABC123_uptime"},
+            "ABC123",
+            "entity_category",
+            EntityCategory.DIAGNOSTIC,
+        ),
+        (
+            {"entity_category": "config", "unique_id": "azen_ABC123_poll_interval"},
+            "ABC123",
+            "entity_category",
+            EntityCategory.CONFIG,
+        ),
+        # Regular sensor without an entity category
+        ({}, "ABC123", "entity_category", None),
+        (
+            {"unique_id": "azen_365102_battery_soc"},
+            "365102",
+            "translation_key",
+            "battery_soc",
+        ),
+        (
+            {"unique_id": "azen_365102_grid_power_l1"},
+            "365102",
+            "translation_key",
+            "grid_power_l1",
+        ),
+        (
+            {"unique_id": "azen_504589_pv_energy"},
+            "504589",
+            "translation_key",
+            "pv_energy",
+        ),
+        # Serial with leading zeros
+        (
+            {"unique_id": "azen_007890_battery_power"},
+            "007890",
+            "translation_key",
+            "battery_power",
+        ),
+        (
+            {"unique_id": "azen_365102_reconnect_count"},
+            "365102",
+            "translation_key",
+            "reconnect_count",
+        ),
+        # No translation key for an unrecognised unique_id format
+        ({"unique_id": "invalid_format"}, "365102", "translation_key", None),
+    ],
+)
+def test_sensor_attribute_mapping(
+    mock_coordinator: _StubCoordinator,
+    sample_discovery_payload: MappingProxyType,
+    payload_overrides: dict,
+    serial: str,
+    attr: str,
+    expected: object,
 ) -> None:
-    """Test discovery payload without unique_id is ignored."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
-
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    callbacks = {}
-    mock_coordinator.set_discovery_callback.side_effect = lambda cb: callbacks.update(
-        {"discovery": cb}
-    )
-    mock_coordinator.set_state_callback.side_effect = lambda cb: None
-    mock_coordinator.set_connection_callback.side_effect = lambda cb: None
-
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
-
-    # Discovery without unique_id (second call since first creates diagnostic sensors)
-    callbacks["discovery"]({"name": "Test", "state_topic": "test"})
-
-    # Should only have diagnostic sensors, not the invalid one
-    assert add_entities_mock.call_count == 1
+    """Test payload-to-attribute mapping across one table of cases."""
+    payload = {**sample_discovery_payload, **payload_overrides}
+    sensor = AzimutSensor(mock_coordinator, payload, serial)
+    assert getattr(sensor, attr) == expected
 
 
 async def test_diagnostic_sensors_created(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
+    setup_sensor_platform: tuple[dict, MagicMock],
 ) -> None:
     """Test that diagnostic sensors are created on setup."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
-
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    # Add mqtt_client to coordinator
-    mqtt_client = MagicMock()
-    mqtt_client.reconnect_count = 2
-    mqtt_client.total_messages_received = 150
-    mock_coordinator.mqtt_client = mqtt_client
-
-    mock_coordinator.set_discovery_callback.side_effect = lambda cb: None
-    mock_coordinator.set_state_callback.side_effect = lambda cb: None
-    mock_coordinator.set_connection_callback.side_effect = lambda cb: None
-
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
+    _, add_entities_mock = setup_sensor_platform
 
     # Verify diagnostic sensors were created
     assert add_entities_mock.call_count == 1
@@ -381,13 +364,10 @@ async def test_diagnostic_sensors_created(
     assert "sensor_count" in sensor_types
 
 
-async def test_diagnostic_sensor_values(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
+def test_diagnostic_sensor_values(
+    mock_coordinator: _StubCoordinator,
 ) -> None:
     """Test diagnostic sensor values."""
-    from custom_components.azimut_energy.sensor import AzimutDiagnosticSensor
-
     # Setup mqtt_client
     mqtt_client = MagicMock()
     mqtt_client.reconnect_count = 3
@@ -429,15 +409,10 @@ async def test_diagnostic_sensor_values(
     assert count_sensor.native_value == 1
 
 
-async def test_diagnostic_sensor_properties(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
+def test_diagnostic_sensor_properties(
+    mock_coordinator: _StubCoordinator,
 ) -> None:
     """Test diagnostic sensor properties."""
-    from homeassistant.helpers.entity import EntityCategory
-
-    from custom_components.azimut_energy.sensor import AzimutDiagnosticSensor
-
     mqtt_client = MagicMock()
     mqtt_client.reconnect_count = 0
     mock_coordinator.mqtt_client = mqtt_client
@@ -449,7 +424,6 @@ async def test_diagnostic_sensor_properties(
         name="MQTT Reconnect Count",
         icon="mdi:connection",
     )
-    sensor.hass = hass
 
     # Check properties
     assert sensor.unique_id == "azen_ABC123_reconnect_count"
@@ -470,34 +444,11 @@ async def test_diagnostic_sensor_properties(
 
 
 async def test_sensor_count_increments_on_discovery(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+    setup_sensor_platform: tuple[dict, MagicMock],
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test sensor count increments when new sensors are discovered."""
-    from custom_components.azimut_energy.sensor import async_setup_entry
-
-    entry = MagicMock()
-    entry.data = {CONF_SERIAL: "ABC123"}
-    entry.entry_id = "test_entry"
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
-
-    # Add mqtt_client
-    mqtt_client = MagicMock()
-    mqtt_client.reconnect_count = 0
-    mqtt_client.total_messages_received = 0
-    mock_coordinator.mqtt_client = mqtt_client
-
-    callbacks = {}
-    mock_coordinator.set_discovery_callback.side_effect = lambda cb: callbacks.update(
-        {"discovery": cb}
-    )
-    mock_coordinator.set_state_callback.side_effect = lambda cb: None
-    mock_coordinator.set_connection_callback.side_effect = lambda cb: None
-
-    add_entities_mock = MagicMock()
-    await async_setup_entry(hass, entry, add_entities_mock)
+    callbacks, add_entities_mock = setup_sensor_platform
 
     # Get the sensor count diagnostic sensor
     diagnostic_sensors = add_entities_mock.call_args[0][0]
@@ -523,80 +474,9 @@ async def test_sensor_count_increments_on_discovery(
     assert sensor_count_diag.native_value == 2
 
 
-async def test_entity_category_from_discovery(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
-) -> None:
-    """Test entity category is properly set from discovery payload."""
-    from homeassistant.helpers.entity import EntityCategory
-
-    # Test diagnostic entity category
-    diagnostic_payload = sample_discovery_payload.copy()
-    diagnostic_payload["entity_category"] = "diagnostic"
-    diagnostic_payload["unique_id"] = "azen_ABC123_uptime"
-    diagnostic_payload["name"] = "Uptime"
-
-    sensor = AzimutSensor(mock_coordinator, diagnostic_payload, "ABC123")
-    assert sensor.entity_category == EntityCategory.DIAGNOSTIC
-
-    # Test config entity category
-    config_payload = sample_discovery_payload.copy()
-    config_payload["entity_category"] = "config"
-    config_payload["unique_id"] = "azen_ABC123_poll_interval"
-    config_payload["name"] = "Poll Interval"
-
-    sensor = AzimutSensor(mock_coordinator, config_payload, "ABC123")
-    assert sensor.entity_category == EntityCategory.CONFIG
-
-    # Test no entity category (regular sensor)
-    regular_payload = sample_discovery_payload.copy()
-    sensor = AzimutSensor(mock_coordinator, regular_payload, "ABC123")
-    assert sensor.entity_category is None
-
-
-async def test_translation_key_from_unique_id(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
-) -> None:
-    """Test translation_key is extracted from unique_id."""
-    # Test battery_soc translation key
-    payload = sample_discovery_payload.copy()
-    payload["unique_id"] = "azen_365102_battery_soc"
-    sensor = AzimutSensor(mock_coordinator, payload, "365102")
-    assert sensor.translation_key == "battery_soc"
-
-    # Test grid_power_l1 translation key
-    payload["unique_id"] = "azen_365102_grid_power_l1"
-    sensor = AzimutSensor(mock_coordinator, payload, "365102")
-    assert sensor.translation_key == "grid_power_l1"
-
-    # Test pv_energy translation key
-    payload["unique_id"] = "azen_504589_pv_energy"
-    sensor = AzimutSensor(mock_coordinator, payload, "504589")
-    assert sensor.translation_key == "pv_energy"
-
-    # Test with serial containing leading zeros
-    payload["unique_id"] = "azen_007890_battery_power"
-    sensor = AzimutSensor(mock_coordinator, payload, "007890")
-    assert sensor.translation_key == "battery_power"
-
-    # Test diagnostic sensor translation key
-    payload["unique_id"] = "azen_365102_reconnect_count"
-    sensor = AzimutSensor(mock_coordinator, payload, "365102")
-    assert sensor.translation_key == "reconnect_count"
-
-    # Test no translation key for invalid unique_id format
-    payload["unique_id"] = "invalid_format"
-    sensor = AzimutSensor(mock_coordinator, payload, "365102")
-    assert not hasattr(sensor, "translation_key") or sensor.translation_key is None
-
-
-async def test_sensor_no_unique_id(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
-    sample_discovery_payload: dict,
+def test_sensor_no_unique_id(
+    mock_coordinator: _StubCoordinator,
+    sample_discovery_payload: MappingProxyType,
 ) -> None:
     """Test sensor creation without unique_id uses name from payload."""
     payload = sample_discovery_payload.copy()
@@ -609,9 +489,8 @@ async def test_sensor_no_unique_id(
     )
 
 
-async def test_diagnostic_sensor_default_value(
-    hass: HomeAssistant,
-    mock_coordinator: MagicMock,
+def test_diagnostic_sensor_default_value(
+    mock_coordinator: _StubCoordinator,
 ) -> None:
     """Test diagnostic sensor returns 0 by default."""
     sensor = AzimutDiagnosticSensor(